@@ -1,7 +1,9 @@
 """
 Budget management and alert system for Expense Tracker.
 """
-from typing import Dict, List, Optional
+from collections import defaultdict
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 import json
@@ -10,6 +12,13 @@ import os
 logger = logging.getLogger(__name__)
 
 
+class Severity(IntEnum):
+    """Budget alert severity; higher values are more urgent."""
+
+    WARN = 1
+    CRITICAL = 2
+
+
 class BudgetManager:
     """Manages category budgets and spending alerts."""
     
@@ -128,8 +137,14 @@ class BudgetManager:
             return success
         return False
     
-    def check_budget_alerts(self):
-        """Check for budget alerts - FIXED: No red alert for 'no budgets' message"""
+    def get_budget_alerts(
+        self, spending_map: Optional[Dict[str, float]] = None
+    ) -> List[Tuple[Severity, str]]:
+        """Return (severity, message) for every budget over or near its limit.
+
+        ``spending_map`` is an optional precomputed result of
+        ``get_monthly_spending_map`` for the current month.
+        """
         alerts = []
         
         # Check if we have any budgets at all
@@ -138,65 +153,72 @@ class BudgetManager:
             # We'll handle this separately in the UI
             return alerts
         
-        current_month = datetime.now().strftime("%Y-%m")
+        if spending_map is None:
+            current_month = datetime.now().strftime("%Y-%m")
+            spending_map = self.get_monthly_spending_map(current_month)
         
         # Check each budget
         for category, budget_limit in self.budgets.items():
-            monthly_spending = self._get_monthly_spending(category, current_month)
+            monthly_spending = spending_map.get(category.lower(), 0.0)
             
             if monthly_spending > budget_limit:
                 # This is a real budget violation - red alert
                 over_amount = monthly_spending - budget_limit
-                alerts.append(
+                alerts.append((
+                    Severity.CRITICAL,
                     f"🚨 Monthly budget exceeded for {category}! "
                     f"Spent ₱{monthly_spending:,.2f} of ₱{budget_limit:,.2f} this month "
-                    f"(₱{over_amount:,.2f} over budget)"
-                )
+                    f"(₱{over_amount:,.2f} over budget)",
+                ))
             elif monthly_spending > budget_limit * 0.8:
                 # Warning alert (approaching budget)
-                alerts.append(
+                alerts.append((
+                    Severity.WARN,
                     f"⚠️ Approaching budget limit for {category}: "
                     f"₱{monthly_spending:,.2f} of ₱{budget_limit:,.2f} "
-                    f"({monthly_spending/budget_limit*100:.1f}%)"
-                )
+                    f"({monthly_spending/budget_limit*100:.1f}%)",
+                ))
         
         return alerts
-    
-    def _get_monthly_spending(self, category: str, month: str) -> float:
-        """Calculate monthly spending for a category (case-insensitive)."""
+
+    def check_budget_alerts(self, spending_map: Optional[Dict[str, float]] = None):
+        """Check for budget alerts - FIXED: No red alert for 'no budgets' message
+
+        Returns the alert messages only; see ``get_budget_alerts`` for severities.
+        """
+        return [message for _, message in self.get_budget_alerts(spending_map)]
+
+    def get_monthly_spending_map(self, month: str) -> Dict[str, float]:
+        """Return {lowercased category: spending} for a month in one pass over expenses."""
+        spending: Dict[str, float] = defaultdict(float)
         try:
-            # Use the existing list_all_expenses method from data_manager
-            all_expenses = self.data_manager.list_all_expenses()
-            monthly_total = 0.0
-            
-            logger.debug(f"🔍 Checking {len(all_expenses)} total expenses for category: {category}, month: {month}")
-            
-            for expense in all_expenses:
-                expense_category = expense.get('category', '')
-                expense_date = expense.get('date', '')
-                expense_amount = expense.get('amount', 0)
-                
-                # Check if this expense belongs to our category (CASE-INSENSITIVE) and current month
-                if (expense_category.lower() == category.lower() and 
-                    expense_date.startswith(month)):
-                    try:
-                        monthly_total += float(expense_amount)
-                        logger.debug(f"   ➕ Added expense: {expense_category} - ₱{expense_amount} on {expense_date}")
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"   ❌ Invalid amount for expense: {expense_amount} - {e}")
-                        continue
-                
-            logger.debug(f"📈 Monthly spending for {category} in {month}: ₱{monthly_total:,.2f}")
-            return monthly_total
-            
+            totals = self.data_manager.get_monthly_category_totals(month)
+            for category, total in totals.items():
+                spending[category.lower()] += total
         except Exception as e:
-            logger.error(f"❌ Error calculating monthly spending for {category}: {e}")
-            return 0.0
+            logger.error(f"❌ Error calculating monthly spending for {month}: {e}")
+            return {}
+        return dict(spending)
+
+    def _get_monthly_spending(self, category: str, month: str) -> float:
+        """Calculate monthly spending for a category (case-insensitive)."""
+        monthly_total = self.get_monthly_spending_map(month).get(category.lower(), 0.0)
+        logger.debug(f"📈 Monthly spending for {category} in {month}: ₱{monthly_total:,.2f}")
+        return monthly_total
     
-    def get_budget_progress(self, category: str) -> Dict[str, float]:
-        """Get monthly budget progress for a category."""
+    def get_budget_progress(
+        self, category: str, spending_map: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """Get monthly budget progress for a category.
+
+        ``spending_map`` is an optional precomputed result of
+        ``get_monthly_spending_map`` for the current month.
+        """
         current_month = datetime.now().strftime("%Y-%m")
-        spent = self._get_monthly_spending(category, current_month)
+        if spending_map is None:
+            spent = self._get_monthly_spending(category, current_month)
+        else:
+            spent = spending_map.get(category.lower(), 0.0)
         budget = self.budgets.get(category, 0)
         
         return {
@@ -207,20 +229,26 @@ class BudgetManager:
             'month': current_month  # Include month for clarity
         }
     
-    def get_all_budgets(self) -> Dict[str, Dict[str, float]]:
-        """Get progress for all monthly budgets."""
+    def get_all_budgets(
+        self, spending_map: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Get progress for all monthly budgets from one spending aggregation."""
+        if spending_map is None:
+            current_month = datetime.now().strftime("%Y-%m")
+            spending_map = self.get_monthly_spending_map(current_month)
         return {
-            category: self.get_budget_progress(category)
+            category: self.get_budget_progress(category, spending_map)
             for category in self.budgets
         }
     
     def get_budget_summary(self) -> Dict:
         """Get complete monthly budget summary with alerts."""
         current_month = datetime.now().strftime("%B %Y")  # e.g., "October 2024"
+        spending_map = self.get_monthly_spending_map(datetime.now().strftime("%Y-%m"))
         
         return {
-            'budgets': self.get_all_budgets(),
-            'alerts': self.check_budget_alerts(),
+            'budgets': self.get_all_budgets(spending_map),
+            'alerts': self.check_budget_alerts(spending_map),
             'total_budget_categories': len(self.budgets),
             'budget_period': f"Monthly ({current_month})",
             'description': "Budgets reset tracking each month"
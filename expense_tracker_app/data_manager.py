@@ -1,11 +1,106 @@
 import json
 import logging
+import math
 import os
+import weakref
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 from expense_tracker_app.budget_manager import BudgetManager
 
+# Live dashboard widgets, so refreshes don't have to walk the widget tree
+_DASHBOARDS = weakref.WeakSet()
+
+
+def register_dashboard(widget):
+    """Register a widget whose update_dashboard() runs on data refreshes."""
+    _DASHBOARDS.add(widget)
+
+
+def refresh_dashboards():
+    """Call update_dashboard() on every registered, still-alive dashboard."""
+    for dashboard in list(_DASHBOARDS):
+        try:
+            dashboard.update_dashboard()
+        except RuntimeError:
+            # Underlying Qt object already deleted
+            _DASHBOARDS.discard(dashboard)
+        except Exception as e:
+            logger.debug(f"Error updating dashboard widget: {e}")
+
+
+def loads_json(raw):
+    """Decode a UTF-8 JSON document, using orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Older files may hold NaN/Infinity, which only stdlib json accepts
+            pass
+    return json.loads(raw)
+
+
+def dumps_json(data):
+    """Encode data as an indented UTF-8 JSON document."""
+    # Always stdlib: orjson can only indent by 2 and writes non-finite floats
+    # as null, so the file would differ depending on what is installed
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date):
+    """Parse a YYYY-MM-DD string into a datetime, memoized per distinct string."""
+    # Fast path for the canonical 10-char form; strptime handles everything else
+    if (
+        isinstance(date, str)
+        and len(date) == 10
+        and date[4] == "-"
+        and date[7] == "-"
+        and (date[:4] + date[5:7] + date[8:]).isdecimal()
+        and date.isascii()
+    ):
+        return datetime(int(date[:4]), int(date[5:7]), int(date[8:]))
+    return datetime.strptime(date, "%Y-%m-%d")
+
+
+def date_sort_key(record):
+    """Sort key putting records in date order, undated records last."""
+    date = record.get("date")
+    if not date:
+        return "~"  # Orders after every digit-led date string
+    # YYYY-MM-DD strings already order chronologically; only other forms are parsed
+    if len(date) == 10:
+        return date
+    return parse_date(date).strftime("%Y-%m-%d")
+
+
+def month_key(date):
+    """Pack the YYYY-MM prefix of a date string into a YYYYMM int, or -1."""
+    if not isinstance(date, str) or len(date) < 7 or date[4] != "-":
+        return -1
+    try:
+        return int(date[:4]) * 100 + int(date[5:7])
+    except ValueError:
+        return -1
+
+
+def sum_by_category(amounts, cat_ids, months, target_month, n_cats):
+    """Sum amounts per category id over the rows falling in target_month."""
+    mask = months == target_month
+    return np.bincount(cat_ids[mask], weights=amounts[mask], minlength=n_cats)
+
+
 class DataManager:
     def __init__(self, filename="expenses.json", file_path=None):
         # Allow file_path parameter for tests
@@ -26,6 +121,17 @@ class DataManager:
         ]
         self.last_deleted = None
         self.last_cleared = None  # Add this for clear undo
+        self._sorted_categories = ()
+        self._sorted_categories_keys = None
+        self._columns = None
+        self._columns_key = None
+        self._sorted = None
+        self._sorted_key = None
+        self._search_index = None
+        self._search_index_key = None
+        self._report_columns = None
+        self._report_columns_key = None
+        self._last_search = None
         self.load_expense()
         self.budget_manager = BudgetManager(self)
 
@@ -107,6 +213,10 @@ class DataManager:
     def load_expense(self, file_path=None):
         """Load expenses from file. Accepts optional file_path for testing."""
         filename_to_load = file_path if file_path else self.filename
+        self._columns = None
+        self._sorted = None
+        self._search_index = None
+        self._report_columns = None
 
         if not os.path.exists(filename_to_load):
             logger.info(
@@ -115,8 +225,8 @@ class DataManager:
             return
 
         try:
-            with open(filename_to_load, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filename_to_load, "rb") as f:
+                data = loads_json(f.read())
                 self.expenses = data.get("expenses", {})
                 self.categories = data.get("categories", self.categories)
 
@@ -157,6 +267,11 @@ class DataManager:
     def save_data(self, file_path=None):
         """Save data to file. Accepts optional file_path for testing."""
         filename_to_save = file_path if file_path else self.filename
+        # Every in-place edit of expenses is followed by a save
+        self._columns = None
+        self._sorted = None
+        self._search_index = None
+        self._report_columns = None
 
         # Handle empty filename case (tests with no file)
         if not filename_to_save:
@@ -170,8 +285,18 @@ class DataManager:
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
 
-            with open(filename_to_save, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            # Encode up front so the document reaches the file in one write(),
+            # then swap it in so a failed save never leaves a truncated file
+            payload = dumps_json(data)
+            temp_path = filename_to_save + ".tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(temp_path, filename_to_save)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
             logger.info("Saved data to %s", filename_to_save)
         except Exception as e:
             logger.error("Failed to save data: %s", e)
@@ -374,36 +499,17 @@ class DataManager:
 
     def add_expense(self, category, amount, date, description):
         """Add expense with validation and normalized category."""
+        normalized_category, amount_float = self._validate_expense(
+            category, amount, date
+        )
 
-        # Validate amount
-        try:
-            amount_float = float(amount)
-            if amount_float <= 0:
-                raise ValueError("Amount must be positive")
-        except (ValueError, TypeError):
-            raise ValueError("Amount must be a valid number")
-
-        # Validate date format (YYYY-MM-DD)
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
-
-        # Normalize category name
-        normalized_category = self.normalize_category_name(category)
-        
         # If normalized category is not in the list, add it
         if normalized_category not in self.categories:
             self.categories.append(normalized_category)
             self.categories.sort()
 
-        # Generate unique ID for the expense
-        all_expenses = self.list_all_expenses()
-        max_id = max([e.get("id", 0) for e in all_expenses]) if all_expenses else 0
-        new_id = max_id + 1
-
         new_record = {
-            "id": new_id,
+            "id": self._max_expense_id() + 1,
             "amount": amount_float,
             "date": date,
             "description": description,
@@ -417,6 +523,71 @@ class DataManager:
         self.debug_expense_categories()
         
         return True
+
+    def add_expenses_bulk(self, rows):
+        """
+        Add (category, amount, date, description) rows with one save and one
+        budget-alert refresh. Rows add_expense would reject are skipped.
+        Returns the number of expenses added.
+        """
+        next_id = self._max_expense_id() + 1
+        added = 0
+        for category, amount, date, description in rows:
+            try:
+                normalized_category, amount_float = self._validate_expense(
+                    category, amount, date
+                )
+            except (ValueError, TypeError) as e:
+                logger.debug("Skipping expense %r: %s", (category, amount, date), e)
+                continue
+
+            if normalized_category not in self.categories:
+                self.categories.append(normalized_category)
+            self.expenses.setdefault(normalized_category, []).append(
+                {
+                    "id": next_id,
+                    "amount": amount_float,
+                    "date": date,
+                    "description": description,
+                }
+            )
+            next_id += 1
+            added += 1
+
+        if added:
+            self.categories.sort()
+            self.save_data()
+            logger.info("Added %d expenses in bulk", added)
+            self.update_budget_alerts()
+            self.debug_expense_categories()
+        return added
+
+    def _validate_expense(self, category, amount, date):
+        """Return (normalized category, float amount) or raise ValueError."""
+        # Validate amount
+        try:
+            amount_float = float(amount)
+            if not math.isfinite(amount_float) or amount_float <= 0:
+                raise ValueError("Amount must be positive")
+        except (ValueError, TypeError):
+            raise ValueError("Amount must be a valid number")
+
+        # Validate date format (YYYY-MM-DD)
+        try:
+            parse_date(date)
+        except ValueError:
+            raise ValueError("Date must be in YYYY-MM-DD format")
+
+        return self.normalize_category_name(category), amount_float
+
+    def _max_expense_id(self):
+        """Highest expense id in use, 0 when there are none."""
+        # Reads the stored ids; list_all_expenses() drops them, which used to
+        # give every new expense id 1
+        return max(
+            (rec.get("id", 0) for records in self.expenses.values() for rec in records),
+            default=0,
+        )
     
     def update_budget_alerts(self):
         """Update budget alerts and refresh dashboard if available."""
@@ -444,15 +615,7 @@ class DataManager:
     def _refresh_all_dashboards(self):
         """Refresh all dashboard widgets."""
         try:
-            from PyQt5.QtWidgets import QApplication, QWidget
-            
-            for w in QApplication.topLevelWidgets():
-                for child in w.findChildren(QWidget):
-                    if hasattr(child, "update_dashboard"):
-                        try:
-                            child.update_dashboard()
-                        except Exception as e:
-                            logger.debug(f"Error updating dashboard widget: {e}")
+            refresh_dashboards()
         except Exception as e:
             logger.error(f"Error in dashboard refresh: {e}")     
 
@@ -478,9 +641,11 @@ class DataManager:
             else:
                 return False
 
-        # Normal record-based deletion - check by value, not reference
-        if record in self.expenses[normalized_category]:
-            self.expenses[normalized_category].remove(record)
+        # Normal record-based deletion - check by value, not reference.
+        # One index() scan locates it; "in" followed by remove() scanned twice.
+        position = self._index_of(self.expenses[normalized_category], record)
+        if position is not None:
+            del self.expenses[normalized_category][position]
             self.last_deleted = (normalized_category, record)
             self.save_data()
             logger.warning("Deleted expense from %s: %s", normalized_category, record)
@@ -507,6 +672,14 @@ class DataManager:
         logger.debug("Delete failed for record: %s", record)
         return False
 
+    @staticmethod
+    def _index_of(records, record):
+        """Return the position of record in records (by value), or None."""
+        try:
+            return records.index(record)
+        except ValueError:
+            return None
+
     def undo_delete(self):
         """Undo last delete or clear operation."""
         # First try to undo a clear
@@ -538,47 +711,98 @@ class DataManager:
         result = self.undo_delete()
         return None if not result else result
 
+    def _expenses_key(self):
+        """Cheap fingerprint of self.expenses used to validate the derived caches."""
+        expenses = self.expenses
+        return (id(expenses), tuple((cat, len(recs)) for cat, recs in expenses.items()))
+
     def get_sorted_expenses(self):
-        """Return expenses dict with records sorted by date (asc)."""
+        """
+        Return expenses dict with records sorted by date (asc).
+        The sorted view is built once and reused until expenses change.
+        """
+        key = self._expenses_key()
+        if self._sorted is not None and self._sorted_key == key:
+            return self._sorted
+
         out = {}
         for cat, records in self.expenses.items():
             try:
-                out[cat] = sorted(
-                    records,
-                    key=lambda r: (
-                        datetime.strptime(r.get("date", ""), "%Y-%m-%d")
-                        if r.get("date")
-                        else datetime.max
-                    ),
-                )
+                out[cat] = sorted(records, key=date_sort_key)
             except Exception:
                 out[cat] = list(records)
+        self._sorted = out
+        self._sorted_key = key
         return out
 
-    def get_category_subtotals(self):
-        return {
-            category: sum(rec.get("amount", 0.0) for rec in records)
-            for category, records in self.expenses.items()
-        }
-
     def search_expenses(self, keyword):
         """
         Search expenses by keyword in description.
         Returns a list of (category, record) tuples.
         """
-        results = []
-        for category, records in self.expenses.items():
-            for record in records:
-                if keyword.lower() in record.get("description", "").lower():
-                    results.append((category, record))
+        keyword = keyword.lower()
+        index = self._get_search_index()
+        # Repeating the last search against the same index returns the same list
+        last = self._last_search
+        if last is not None and last[0] is index and last[1] == keyword:
+            return last[2]
+
+        results = [
+            (category, record)
+            for category, record, description in index
+            if keyword in description
+        ]
+        self._last_search = (index, keyword, results)
         logger.debug(
             "Search for keyword='%s' returned %d results", keyword, len(results)
         )
         return results
 
+    def _get_search_index(self):
+        """Return cached (category, record, lowercased description) triples."""
+        key = self._expenses_key()
+        if self._search_index is not None and self._search_index_key == key:
+            return self._search_index
+
+        self._search_index = [
+            (category, record, record.get("description", "").lower())
+            for category, records in self.expenses.items()
+            for record in records
+        ]
+        self._search_index_key = key
+        return self._search_index
+
     def get_all_categories(self):
         return list(self.expenses.keys())
 
+    def get_known_categories(self):
+        """Return configured categories plus any category that has expenses."""
+        known = set(self.categories)
+        known.update(category for category, records in self.expenses.items() if records)
+        return known
+
+    def find_category(self, category):
+        """
+        Return the existing category matching a name case-insensitively, or None.
+        Configured categories win over names that only appear on expenses.
+        """
+        category_lower = category.lower()
+        for existing in self.categories:
+            if existing.lower() == category_lower:
+                return existing
+        for existing, records in self.expenses.items():
+            if records and existing.lower() == category_lower:
+                return existing
+        return None
+
+    def get_sorted_categories(self):
+        """Return expense category names sorted, re-sorting only when they change."""
+        keys = self.expenses.keys()
+        if self._sorted_categories_keys != keys:
+            self._sorted_categories_keys = frozenset(keys)
+            self._sorted_categories = tuple(sorted(keys))
+        return self._sorted_categories
+
     def update_expense(self, old_category, old_record, new_data):
         """
         Update an existing expense. Removes the old record from its category
@@ -586,13 +810,12 @@ class DataManager:
         Falls back to old_record values if new_data is incomplete.
         """
         normalized_old_category = self.normalize_category_name(old_category)
-        if (
-            normalized_old_category not in self.expenses
-            or old_record not in self.expenses[normalized_old_category]
-        ):
+        old_records = self.expenses.get(normalized_old_category)
+        position = None if old_records is None else self._index_of(old_records, old_record)
+        if position is None:
             return False  # ✅ return False if nothing found
 
-        self.expenses[normalized_old_category].remove(old_record)
+        del old_records[position]
 
         category = self.normalize_category_name(new_data.get("category", normalized_old_category))
         amount = float(new_data.get("amount", old_record.get("amount", 0)))
@@ -617,10 +840,10 @@ class DataManager:
 
     def get_category_subtotals(self):
         """Return a dict of {category: subtotal_amount}."""
-        subtotals = {
-            category: sum(rec.get("amount", 0.0) or 0.0 for rec in records)
-            for category, records in self.expenses.items()
-        }
+        # Amounts in the cached columns were cast to float once, when built
+        names, amounts, cat_ids, _ = self.get_expense_columns()
+        sums = np.bincount(cat_ids, weights=amounts, minlength=len(names))
+        subtotals = dict(zip(names, sums.tolist()))
         logger.debug("Calculated category subtotals: %s", subtotals)
         return subtotals
 
@@ -638,19 +861,100 @@ class DataManager:
         """
         Return a dict of {YYYY-MM: total_amount} for all expenses.
         Useful for trends and time-series analysis.
+        Sums the cached YYYYMM month column in one vectorized pass, keys in date order.
         """
-        monthly_totals = {}
-        for records in self.expenses.values():
-            for rec in records:
-                date = rec.get("date", "")
-                amount = rec.get("amount", 0.0) or 0.0
-                if date:
-                    month = date[:7]  # YYYY-MM
-                    monthly_totals[month] = monthly_totals.get(month, 0.0) + amount
+        _, amounts, _, months = self.get_expense_columns()
+        dated = months >= 0  # month_key() marks missing/malformed dates as -1
+        if not dated.any():
+            logger.debug("Calculated monthly totals: {}")
+            return {}
+
+        keys, inverse = np.unique(months[dated], return_inverse=True)
+        sums = np.bincount(inverse, weights=amounts[dated])
+        monthly_totals = {
+            f"{key // 100:04d}-{key % 100:02d}": total
+            for key, total in zip(keys.tolist(), sums.tolist())
+        }
 
         logger.debug("Calculated monthly totals: %s", monthly_totals)
         return monthly_totals
 
+    def get_expense_columns(self):
+        """
+        Return (category names, amounts, category ids, YYYYMM months) for all expenses.
+        The parallel arrays are built once and reused until expenses change.
+        """
+        expenses = self.expenses
+        key = self._expenses_key()
+        if self._columns is not None and self._columns_key == key:
+            return self._columns
+
+        names = []
+        amounts = []
+        cat_ids = []
+        months = []
+        for cat_id, (category, records) in enumerate(expenses.items()):
+            names.append(category)
+            for rec in records:
+                amount = rec.get("amount", 0)
+                try:
+                    amounts.append(float(amount))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"   ❌ Invalid amount for expense: {amount} - {e}")
+                    continue
+                cat_ids.append(cat_id)
+                months.append(month_key(rec.get("date", "")))
+
+        self._columns = (
+            names,
+            np.asarray(amounts, dtype=np.float64),
+            np.asarray(cat_ids, dtype=np.int32),
+            np.asarray(months, dtype=np.int32),
+        )
+        self._columns_key = key
+        return self._columns
+
+    def get_report_columns(self):
+        """
+        Return (entries, lowercased categories, date ordinals) for report filtering.
+        entries holds one (category, record) pair per expense, where a record's own
+        "category" key wins over its bucket; undated or unparseable dates are -1.
+        The arrays are built once and reused until expenses change.
+        """
+        key = self._expenses_key()
+        if self._report_columns is not None and self._report_columns_key == key:
+            return self._report_columns
+
+        entries = []
+        categories = []
+        ordinals = []
+        for bucket, records in self.expenses.items():
+            for rec in records:
+                category = rec.get("category") or bucket
+                if category is None:
+                    category = "Uncategorized"
+                try:
+                    ordinal = parse_date(rec.get("date", "")).toordinal()
+                except Exception:
+                    ordinal = -1
+                entries.append((category, rec))
+                categories.append(str(category).strip().lower())
+                ordinals.append(ordinal)
+
+        self._report_columns = (
+            entries,
+            np.asarray(categories, dtype=str),
+            np.asarray(ordinals, dtype=np.int64),
+        )
+        self._report_columns_key = key
+        return self._report_columns
+
+    def get_monthly_category_totals(self, month):
+        """Return {category: total} for a YYYY-MM month in one vectorized pass."""
+        names, amounts, cat_ids, months = self.get_expense_columns()
+        sums = sum_by_category(amounts, cat_ids, months, month_key(month), len(names))
+        return dict(zip(names, sums.tolist()))
+
     # ---------- Testable helpers ----------
 
     def list_all_expenses(self):
@@ -1,4 +1,5 @@
 import logging
+import weakref
 
 from PyQt5.QtCore import QDate
 from PyQt5.QtWidgets import (QCalendarWidget, QComboBox, QDialog,
@@ -8,10 +9,41 @@ from PyQt5.QtWidgets import (QCalendarWidget, QComboBox, QDialog,
                              )
 from PyQt5.QtGui import QColor, QFont, QTextCharFormat
 
-from expense_tracker_app.data_manager import DataManager
+from expense_tracker_app.data_manager import DataManager, refresh_dashboards
 
 logger = logging.getLogger(__name__)
 
+QSS_ADD_EXPENSE_DIALOG = """
+    QLineEdit#expenseInput {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        padding: 8px;
+        font-family: "Segoe UI";
+        font-size: 12px;
+    }
+    QLineEdit#expenseInput:focus {
+        border: 1px solid #007acc;
+    }
+    QLabel#categoryHint {
+        color: #ffb86c;
+        background-color: #443322;
+        padding: 8px;
+        border-radius: 6px;
+        border: 1px solid #ffa500;
+        font-size: 11px;
+    }
+"""
+
+# Open AddExpenseDialogs, so category refreshes don't walk the widget tree
+_ADD_EXPENSE_DIALOGS = weakref.WeakSet()
+
+
+def open_add_expense_dialogs():
+    """Return the AddExpenseDialogs that are still alive."""
+    return list(_ADD_EXPENSE_DIALOGS)
+
 
 class CategoryDialog(QDialog):
     def __init__(self, data_manager, parent=None):
@@ -494,48 +526,30 @@ class CategoryDialog(QDialog):
             return None  # User cancelled
 
     def _refresh_dashboards(self):
-        # avoid importing DashboardWidget to prevent circular import;
-        # instead search for widgets with update_dashboard method
-        from PyQt5.QtWidgets import QApplication, QWidget
-
-        for w in QApplication.topLevelWidgets():
-            for child in w.findChildren(QWidget):
-                if hasattr(child, "update_dashboard"):
-                    try:
-                        child.update_dashboard()
-                    except Exception:
-                        pass
+        refresh_dashboards()
 
 
 class AddExpenseDialog(QDialog):
     def __init__(self, categories, parent=None):
         super().__init__(parent)
+        _ADD_EXPENSE_DIALOGS.add(self)
         self.setWindowTitle("Add / Edit Expense")
         self.resize(420, 420)
 
+        # One sheet for the whole dialog, parsed once per dialog
+        self.setStyleSheet(QSS_ADD_EXPENSE_DIALOG)
         layout = QVBoxLayout(self)
 
         self.category_dropdown = QComboBox()
         self.category_dropdown.setMinimumHeight(35)
         self.category_dropdown.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.category_dropdown.addItems(categories)
+        # Categories last loaded into the dropdown, checked before rebuilding it
+        self.dropdown_categories = tuple(categories)
 
         self.amount_input = QLineEdit()
         self.amount_input.setPlaceholderText("Enter amount")
-        self.amount_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: "Segoe UI";
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-        """)
+        self.amount_input.setObjectName("expenseInput")
 
         self.calendar_widget = QCalendarWidget()
         self.calendar_widget.setGridVisible(True)
@@ -545,20 +559,7 @@ class AddExpenseDialog(QDialog):
 
         self.desc_input = QLineEdit()
         self.desc_input.setPlaceholderText("Enter description")
-        self.desc_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: "Segoe UI";
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-        """)
+        self.desc_input.setObjectName("expenseInput")
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -567,16 +568,7 @@ class AddExpenseDialog(QDialog):
         layout.addWidget(QLabel("Category:"))
         layout.addWidget(self.category_dropdown)
         category_hint = QLabel("💡 Need a new category? Use the '📁 Categories' button in the main toolbar")
-        category_hint.setStyleSheet("""
-            QLabel {
-                color: #ffb86c;
-                background-color: #443322;
-                padding: 8px;
-                border-radius: 6px;
-                border: 1px solid #ffa500;
-                font-size: 11px;
-            }
-        """)
+        category_hint.setObjectName("categoryHint")
         category_hint.setWordWrap(True)
         layout.addWidget(category_hint)
         layout.addWidget(QLabel("Amount:"))
@@ -18,33 +18,56 @@ class DataImportService:
 
         logger.info("Importing from CSV: %s", file_path)
         data = {}
+        rows = []
         success = False
 
         try:
             if not isinstance(file_path, (str, bytes, os.PathLike)):
                 raise TypeError(f"Expected file path, got {type(file_path).__name__}")
 
-            with open(file_path, newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                if "category" not in reader.fieldnames:
+            with open(
+                file_path, newline="", encoding="utf-8", buffering=1 << 16
+            ) as csvfile:
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if header is None:
+                    raise ValueError("CSV file is empty")
+                # Same column resolution as DictReader: the last duplicate wins
+                columns = {name: i for i, name in enumerate(header)}
+                if "category" not in columns:
                     logger.warning("Invalid CSV format: missing category column")
                     return {}
 
+                category_i = columns["category"]
+                amount_i = columns.get("amount")
+                date_i = columns.get("date")
+                description_i = columns.get("description")
+                width = len(header)
+
                 for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        # Short rows read as None, like DictReader's restval
+                        row += [None] * (width - len(row))
                     try:
-                        raw_category = row.get("category", "").strip()
+                        raw_category = row[category_i].strip()
                         category = raw_category if raw_category else "Uncategorized"
                         category = category.lower()  # ✅ normalize
 
                         try:
-                            amount = float(row.get("amount", 0))
+                            amount = float(row[amount_i] if amount_i is not None else 0)
                             if amount <= 0:
                                 continue
                         except (ValueError, TypeError):
                             continue
 
-                        date = row.get("date", "").strip()
-                        description = row.get("description", "").strip()
+                        date = row[date_i].strip() if date_i is not None else ""
+                        description = (
+                            row[description_i].strip()
+                            if description_i is not None
+                            else ""
+                        )
 
                         rec = {
                             "amount": amount,
@@ -52,16 +75,16 @@ class DataImportService:
                             "description": description,
                         }
                         data.setdefault(category, []).append(rec)
-
-                        if data_manager:
-                            data_manager.add_expense(
-                                category, amount, date, description
-                            )
+                        rows.append((category, amount, date, description))
 
                     except Exception as e:
                         logger.debug("Error processing CSV row: %s", e)
                         continue
 
+            # One insert, save and budget-alert refresh for the whole file
+            if data_manager and rows:
+                data_manager.add_expenses_bulk(rows)
+
             success = True
             return {"success": True, "data": data}
         except Exception as e:
@@ -77,17 +100,26 @@ class DataImportService:
 
         logger.info("Importing from Excel: %s", file_path)
         data = {}
+        rows = []
         success = False
 
         try:
             if not isinstance(file_path, (str, bytes, os.PathLike)):
                 raise TypeError(f"Expected file path, got {type(file_path).__name__}")
 
-            wb = openpyxl.load_workbook(file_path)
-            sheet = wb.active
+            # Read-only mode streams cell values instead of building the full
+            # workbook object graph; it keeps the file open until close()
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                sheet_rows = list(wb.active.iter_rows(values_only=True))
+            finally:
+                wb.close()
+
+            if not sheet_rows:
+                raise ValueError("Excel sheet is empty")
 
             headers = [
-                str(c.value).strip().lower() if c.value else "" for c in sheet[1]
+                str(value).strip().lower() if value else "" for value in sheet_rows[0]
             ]
             if "category" not in headers:
                 logger.warning("Invalid Excel format: missing category column")
@@ -100,7 +132,7 @@ class DataImportService:
                 headers.index("description") if "description" in headers else None
             )
 
-            for row in sheet.iter_rows(min_row=2, values_only=True):
+            for row in sheet_rows[1:]:
                 if not any(row):
                     continue
                 try:
@@ -145,14 +177,16 @@ class DataImportService:
 
                     rec = {"amount": amount, "date": date, "description": description}
                     data.setdefault(category, []).append(rec)
-
-                    if data_manager:
-                        data_manager.add_expense(category, amount, date, description)
+                    rows.append((category, amount, date, description))
 
                 except Exception as e:
                     logger.debug("Error processing Excel row: %s", e)
                     continue
 
+            # One insert, save and budget-alert refresh for the whole sheet
+            if data_manager and rows:
+                data_manager.add_expenses_bulk(rows)
+
             success = True
             return {"success": True, "data": data}
         except Exception as e:
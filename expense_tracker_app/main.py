@@ -2,23 +2,24 @@ import csv
 import logging
 import os
 import sys
-from datetime import datetime
 
+import numpy as np
 import openpyxl
 from fpdf import FPDF
 from PyQt5.QtCore import QDate
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (QApplication, QComboBox, QDateEdit, QFileDialog,
                              QHBoxLayout, QHeaderView, QLabel, QMainWindow,
-                             QMessageBox, QPushButton, QTableWidget,
-                             QTableWidgetItem, QTabWidget, QVBoxLayout,
+                             QMessageBox, QPushButton, QTableView,
+                             QTabWidget, QVBoxLayout,
                              QWidget, QAction, QDialog)
 from PyQt5.QtCore import Qt 
-from expense_tracker_app.data_manager import DataManager
+from expense_tracker_app.data_manager import DataManager, parse_date
 from expense_tracker_app.dialogs import AddExpenseDialog, CategoryDialog
 from expense_tracker_app.import_service import DataImportService
 from expense_tracker_app.reports import ReportService
-from expense_tracker_app.widgets import DashboardWidget, ExpenseTracker
+from expense_tracker_app.widgets import (DashboardWidget, ExpenseTracker,
+                                         ReportTableModel)
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +40,11 @@ logger.debug("Application started with logging configured")
 
 
 class MainWindow(QMainWindow):
+    # (report columns, filter key, result) of the last get_filtered_expenses call
+    _filtered_cache = None
+    # (filtered list, total, joined category names) behind the report summary
+    _report_summary = None
+
     def __init__(self):
         super().__init__()
         self.data_manager = DataManager()
@@ -323,18 +329,16 @@ class MainWindow(QMainWindow):
         )
         reports_layout.addWidget(self.summary_label)
 
-        self.report_table = QTableWidget()
-        self.report_table.setColumnCount(4)
-        self.report_table.setHorizontalHeaderLabels(
-            ["Category", "Amount", "Date", "Description"]
-        )
+        self.report_table = QTableView()
+        self.report_model = ReportTableModel(self)
+        self.report_table.setModel(self.report_model)
         self.report_table.horizontalHeader().setStretchLastSection(True)
         self.report_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         # Dark neon table styling
         self.report_table.setStyleSheet(
             """
-            QTableWidget {
+            QTableView {
             background-color: #252526;
             color: #e0e0e0;
             gridline-color: #404040;
@@ -344,14 +348,14 @@ class MainWindow(QMainWindow):
             font-size: 12px;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             background-color: #252526;
             color: #e0e0e0;
             padding: 8px 12px;
             border-bottom: 1px solid #404040;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background-color: #007acc;
             color: #ffffff;
         }
@@ -482,37 +486,32 @@ class MainWindow(QMainWindow):
     def update_report_view(self):
         """Update the report table with currently filtered expenses."""
         filtered = self.get_filtered_expenses()
-        self.report_table.setRowCount(0)
-
-        total_amount = 0
-        categories = set()
-
-        for row_idx, exp in enumerate(filtered):
-            self.report_table.insertRow(row_idx)
-
-            values = [
-                exp.get("category", ""),
-                str(exp.get("amount", "")),
-                exp.get("date", ""),
-                exp.get("description", ""),
-            ]
-
-            # accumulate
-            try:
-                amt_val = float(exp.get("amount", 0))
-                total_amount += amt_val
-            except Exception:
-                pass
-            categories.add(exp.get("category", ""))
+        # One model reset; cells are formatted lazily as the view paints them
+        self.report_model.set_rows(filtered)
+
+        # get_filtered_expenses hands back the same list while the filters and
+        # data are unchanged, so its totals only need summing once
+        summary = self._report_summary
+        if summary is None or summary[0] is not filtered:
+            total_amount = 0
+            categories = set()
+
+            for exp in filtered:
+                # accumulate
+                try:
+                    amt_val = float(exp.get("amount", 0))
+                    total_amount += amt_val
+                except Exception:
+                    pass
+                categories.add(exp.get("category", ""))
 
-            for col_idx, val in enumerate(values):
-                item = QTableWidgetItem(str(val))
-                self.report_table.setItem(row_idx, col_idx, item)
+            summary = (filtered, total_amount, ", ".join(sorted(categories)))
+            self._report_summary = summary
+        _, total_amount, cats = summary
 
         self.report_table.resizeColumnsToContents()
 
         if filtered:
-            cats = ", ".join(sorted(categories))
             self.summary_label.setText(
                 f"Summary: {len(filtered)} expenses | Categories: {cats} | Total: ₱{total_amount:.2f}"
             )
@@ -525,50 +524,42 @@ class MainWindow(QMainWindow):
             self.dashboard.update_dashboard()
 
     def get_filtered_expenses(self):
-        """Return filtered expenses based on category and date range."""
-        try:
-            self.data_manager.load_expense()
-        except TypeError:
-            pass
-
-        expenses = []
+        """
+        Return filtered expenses based on category and date range.
+        The last result is reused while the filters and the data are unchanged,
+        so the report view and both exports share one filtering pass.
+        """
         category_filter = self.category_filter.currentText().strip().lower()
 
-        start = self.start_date.date().toPyDate()
-        end = self.end_date.date().toPyDate()
+        start = self.start_date.date().toPyDate().toordinal()
+        end = self.end_date.date().toPyDate().toordinal()
 
-        for cat, items in self.data_manager.expenses.items():
-            for e in items:
-                entry_category = (
-                    e.get("category")
-                    if isinstance(e, dict) and e.get("category")
-                    else cat
-                )
-                if entry_category is None:
-                    entry_category = "Uncategorized"
+        # The columns object is rebuilt whenever expenses change
+        entries, categories, ordinals = self.data_manager.get_report_columns()
+        key = (start, end, category_filter)
+        cached = self._filtered_cache
+        if cached is not None and cached[0] is entries and cached[1] == key:
+            return cached[2]
 
-                exp_date = None
-                try:
-                    exp_date = datetime.strptime(e.get("date", ""), "%Y-%m-%d").date()
-                except Exception:
-                    exp_date = None
+        # Date and category tests run as array comparisons over cached columns;
+        # undated records (ordinal -1) always pass the date test
+        mask = (ordinals < 0) | ((ordinals >= start) & (ordinals <= end))
+        if category_filter != "all":
+            mask &= categories == category_filter
 
-                match_category = (category_filter == "all") or (
-                    str(entry_category).strip().lower() == category_filter
-                )
-
-                match_date = not exp_date or (start <= exp_date <= end)
-
-                if match_category and match_date:
-                    expenses.append(
-                        {
-                            "category": entry_category,
-                            "amount": e.get("amount", 0),
-                            "date": e.get("date", ""),
-                            "description": e.get("description", ""),
-                        }
-                    )
+        expenses = []
+        for index in np.flatnonzero(mask).tolist():
+            category, e = entries[index]
+            expenses.append(
+                {
+                    "category": category,
+                    "amount": e.get("amount", 0),
+                    "date": e.get("date", ""),
+                    "description": e.get("description", ""),
+                }
+            )
 
+        self._filtered_cache = (entries, key, expenses)
         return expenses
 
     def get_all_expense_dates(self):
@@ -580,7 +571,7 @@ class MainWindow(QMainWindow):
                 if date_str:
                     try:
                         # Validate the date format
-                        datetime.strptime(date_str, "%Y-%m-%d")
+                        parse_date(date_str)
                         all_dates.append(date_str)
                     except ValueError:
                         continue  # Skip invalid dates
@@ -1120,12 +1111,12 @@ if __name__ == "__main__":
         }
         
         /* Table Scrollbars */
-        QTableWidget QScrollBar:vertical, QListWidget QScrollBar:vertical {
+        QTableView QScrollBar:vertical, QListWidget QScrollBar:vertical {
             background: #2d2d2d;
             width: 15px;
         }
         
-        QTableWidget QScrollBar::handle:vertical, QListWidget QScrollBar::handle:vertical {
+        QTableView QScrollBar::handle:vertical, QListWidget QScrollBar::handle:vertical {
             background: #007acc;
             border-radius: 7px;
             min-height: 25px;
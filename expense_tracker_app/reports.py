@@ -98,18 +98,20 @@ class ReportService:
 
         try:
             rows = ReportService._iter_rows_from_data(data_rows)
-            with open(filename, mode="w", newline="", encoding="utf-8") as f:
+            with open(
+                filename, mode="w", newline="", encoding="utf-8", buffering=1 << 16
+            ) as f:
                 writer = csv.writer(f)
                 writer.writerow(headers)
-                for r in rows:
-                    writer.writerow(
-                        [
-                            r.get("category", ""),
-                            r.get("amount", 0),
-                            r.get("date", ""),
-                            r.get("description", ""),
-                        ]
+                writer.writerows(
+                    (
+                        r.get("category", ""),
+                        r.get("amount", 0),
+                        r.get("date", ""),
+                        r.get("description", ""),
                     )
+                    for r in rows
+                )
             logger.info("CSV export successful: %s", filename)
             return filename
         except Exception as e:
@@ -124,18 +126,25 @@ class ReportService:
 
         try:
             rows = ReportService._iter_rows_from_data(data_rows)
-            workbook = xlsxwriter.Workbook(filename)
+            # Rows are written strictly in order, so each one can be flushed to
+            # disk as soon as the next starts instead of held until close()
+            workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
             ws = workbook.add_worksheet("Expenses")
 
             header_fmt = workbook.add_format({"bold": True, "bg_color": "#dce6f1"})
-            for c, h in enumerate(headers):
-                ws.write(0, c, h, header_fmt)
+            ws.write_row(0, 0, headers, header_fmt)
 
             for row, r in enumerate(rows, start=1):
-                ws.write(row, 0, r.get("category", ""))
-                ws.write(row, 1, r.get("amount", 0))
-                ws.write(row, 2, r.get("date", ""))
-                ws.write(row, 3, r.get("description", ""))
+                ws.write_row(
+                    row,
+                    0,
+                    (
+                        r.get("category", ""),
+                        r.get("amount", 0),
+                        r.get("date", ""),
+                        r.get("description", ""),
+                    ),
+                )
 
             ws.set_column("A:A", 20)
             ws.set_column("B:B", 12)
@@ -1,8 +1,21 @@
+import math
+
+
 def calculate_subtotal(records):
     """Return subtotal of a list of expense records."""
     return sum(rec.get("amount", 0.0) or 0.0 for rec in records)
 
 
+def compute_totals(expenses_by_category):
+    """Return ({category: subtotal}, grand_total) in a single pass."""
+    subtotals = {}
+    for category, records in expenses_by_category.items():
+        subtotals[category] = math.fsum(
+            float(rec.get("amount", 0.0) or 0.0) for rec in records
+        )
+    return subtotals, math.fsum(subtotals.values())
+
+
 def format_expense_row(category, record):
     """Return a dict for an expense row (used in QTableWidget)."""
     return {
@@ -1,22 +1,29 @@
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import \
     FigureCanvasQTAgg as FigureCanvas
-from PyQt5.QtCore import QDate, QPropertyAnimation, Qt, QTimer
-from PyQt5.QtGui import QColor, QFont, QKeySequence, QTextCharFormat
-from PyQt5.QtWidgets import (QAbstractItemView, QComboBox, QDateEdit, QDialog,
-                             QFileDialog, QGraphicsOpacityEffect, QHBoxLayout,
+from PyQt5.QtCore import (QAbstractTableModel, QDate, QEvent, QModelIndex,
+                          QPropertyAnimation, QRect, QSize, Qt, QTimer,
+                          pyqtSignal)
+from PyQt5.QtGui import (QBrush, QColor, QFont, QKeySequence, QLinearGradient,
+                         QPainter, QTextCharFormat)
+from PyQt5.QtWidgets import (QAbstractItemView, QApplication, QComboBox,
+                             QDateEdit, QDialog, QFileDialog,
+                             QGraphicsOpacityEffect, QHBoxLayout,
                              QHeaderView, QLabel, QLineEdit, QMessageBox,
-                             QPushButton, QShortcut, QSizePolicy, QTableWidget,
+                             QPushButton, QShortcut, QSizePolicy, QStyle,
+                             QStyledItemDelegate, QTableView, QTableWidget,
                              QTableWidgetItem, QTabWidget, QVBoxLayout,
                              QWidget, QTextEdit, QProgressBar, QSplitter,
                              QScrollArea)
 
-from expense_tracker_app.data_manager import DataManager
-from expense_tracker_app.dialogs import AddExpenseDialog, CategoryDialog
-from expense_tracker_app.budget_manager import BudgetManager
+from expense_tracker_app.data_manager import (DataManager, parse_date,
+                                              refresh_dashboards,
+                                              register_dashboard)
+from expense_tracker_app.dialogs import (AddExpenseDialog, CategoryDialog,
+                                         open_add_expense_dialogs)
+from expense_tracker_app.budget_manager import BudgetManager, Severity
 from expense_tracker_app.table_helpers import (aggregate_category_totals,
-                                               calculate_subtotal,
-                                               format_expense_row,
+                                               compute_totals,
                                                format_total_row,
                                                prepare_chart_data,
                                                prepare_trend_data)
@@ -30,27 +37,522 @@ except ImportError:
     HAS_PDF = False
 
 import logging
+import math
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
+# Matches stored YYYY-MM-DD dates, which order correctly as plain strings
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
 
 class NumericTableWidgetItem(QTableWidgetItem):
-    def __lt__(self, other):
-        try:
-            if self.data(Qt.UserRole) == "grand_total":
-                return False
-            if other.data(Qt.UserRole) == "grand_total":
-                return True
-        except Exception:
-            pass
+    """Table item that sorts by a numeric value parsed once, not per comparison."""
+
+    def __init__(self, text="", value=None):
+        super().__init__(text)
+        self._sort_value = self._parse(text) if value is None else float(value)
+        self._is_grand_total = False
 
+    @staticmethod
+    def _parse(text):
         try:
-            a = float(self.text().replace("₱", "").replace(",", ""))
-            b = float(other.text().replace("₱", "").replace(",", ""))
+            return float(text.replace("₱", "").replace(",", ""))
+        except ValueError:
+            return None
+
+    def setData(self, role, value):
+        super().setData(role, value)
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            self._sort_value = self._parse(self.text())
+        elif role == Qt.UserRole:
+            self._is_grand_total = value == "grand_total"
+
+    def __lt__(self, other):
+        if self._is_grand_total:
+            return False
+        if getattr(other, "_is_grand_total", False):
+            return True
+
+        a = self._sort_value
+        b = getattr(other, "_sort_value", None)
+        if a is not None and b is not None:
             return a < b
-        except Exception:
-            return super().__lt__(other)
+        return super().__lt__(other)
+
+
+# Extra role carrying the row kind (expense, subtotal, grand total, empty)
+ROW_KIND_ROLE = Qt.UserRole + 1
+
+# Fonts and colours for total rows, built once; Qt shares them implicitly
+TOTAL_FONT = QFont("Segoe UI", 11, QFont.Bold)
+GRAND_TOTAL_FONT = QFont("Segoe UI", 12, QFont.Bold)
+SUBTOTAL_BG = QColor("#00ffff")
+GRAND_TOTAL_BG = QColor("#ffff00")
+TOTAL_FG = QColor("#0f3460")
+HIGHLIGHT_FG = QColor("#ffff00")
+# Budget spending status colours
+OVER_BUDGET_FG = QColor("#ff6b6b")
+NEAR_BUDGET_FG = QColor("#ffb86c")
+UNDER_BUDGET_FG = QColor("#6bff6b")
+
+# Text of the expenses tab summary label
+TOTAL_LABEL_FORMAT = "Total: ₱{:,.2f}".format
+
+
+class ExpenseTableModel(QAbstractTableModel):
+    """Column-wise model behind the expenses table view."""
+
+    HEADERS = ["Category", "Amount", "Date", "Description", "Actions"]
+    ACTIONS_COLUMN = 4
+
+    ROW_EXPENSE = "expense"
+    ROW_SUBTOTAL = "subtotal"
+    ROW_GRAND_TOTAL = "grand_total"
+    ROW_EMPTY = "empty"
+
+    # Placeholder row shown when there is nothing to display
+    EMPTY_ROW = (ROW_EMPTY, "📊 No data available", 0.0, "", "", "", None)
+
+    # Parallel per-row lists, in row order
+    COLUMNS = (
+        "kinds",
+        "categories",
+        "amounts",
+        "amount_texts",
+        "dates",
+        "descriptions",
+        "records",
+    )
+
+    SUBTOTAL_BRUSH = QBrush(SUBTOTAL_BG)
+    GRAND_TOTAL_BRUSH = QBrush(GRAND_TOTAL_BG)
+    TOTAL_TEXT_BRUSH = QBrush(TOTAL_FG)
+    EMPTY_TEXT_BRUSH = QBrush(HIGHLIGHT_FG)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        for name in self.COLUMNS:
+            setattr(self, name, [])
+        # Row of the grand total or empty-state row, -1 when there is none
+        self.pinned_row = -1
+
+    @classmethod
+    def expense_row(cls, category, record):
+        """Return a row tuple for a single expense record.
+
+        The amount text is left as None and formatted on first display,
+        so only rows that are actually painted pay for formatting.
+        """
+        return (
+            cls.ROW_EXPENSE,
+            category,
+            float(record.get("amount", 0.0) or 0.0),
+            None,
+            record.get("date", ""),
+            record.get("description", ""),
+            record,
+        )
+
+    @classmethod
+    def total_row(cls, category_name, subtotal, is_grand=False):
+        """Return a row tuple for a subtotal or grand total."""
+        formatted = format_total_row(category_name, subtotal, is_grand)
+        kind = cls.ROW_GRAND_TOTAL if is_grand else cls.ROW_SUBTOTAL
+        return (kind, formatted["category"], subtotal, formatted["amount"], "", "", None)
+
+    def set_rows(self, rows):
+        """Replace the model contents with a list of row tuples."""
+        self.beginResetModel()
+        if rows:
+            for name, values in zip(self.COLUMNS, zip(*rows)):
+                setattr(self, name, list(values))
+        else:
+            for name in self.COLUMNS:
+                setattr(self, name, [])
+        self.pinned_row = self._find_pinned_row()
+        self.endResetModel()
+
+    def _find_pinned_row(self):
+        pinned = (self.ROW_GRAND_TOTAL, self.ROW_EMPTY)
+        for row, kind in enumerate(self.kinds):
+            if kind in pinned:
+                return row
+        return -1
+
+    def record_at(self, row):
+        """Return (category, record) for an expense row, or None."""
+        if 0 <= row < len(self.kinds) and self.kinds[row] == self.ROW_EXPENSE:
+            return self.categories[row], self.records[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.kinds)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        kind = self.kinds[row]
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self.categories[row]
+            if col == 1:
+                text = self.amount_texts[row]
+                if text is None:
+                    # Same format as format_expense_row, from the coerced float
+                    text = f"{self.amounts[row]:.2f}"
+                    self.amount_texts[row] = text
+                return text
+            if col == 2:
+                return self.dates[row]
+            if col == 3:
+                return self.descriptions[row]
+            return ""
+        if role == ROW_KIND_ROLE:
+            return kind
+        if kind == self.ROW_EXPENSE:
+            return None
+        if kind == self.ROW_EMPTY:
+            if col == 0 and role == Qt.FontRole:
+                return GRAND_TOTAL_FONT
+            if col == 0 and role == Qt.ForegroundRole:
+                return self.EMPTY_TEXT_BRUSH
+            return None
+
+        # Subtotal and grand total rows style their category/amount cells
+        if col > 1:
+            return None
+        is_grand = kind == self.ROW_GRAND_TOTAL
+        if role == Qt.FontRole:
+            return GRAND_TOTAL_FONT if is_grand else TOTAL_FONT
+        if role == Qt.BackgroundRole:
+            return self.GRAND_TOTAL_BRUSH if is_grand else self.SUBTOTAL_BRUSH
+        if role == Qt.ForegroundRole:
+            return self.TOTAL_TEXT_BRUSH
+        if role == Qt.UserRole and is_grand:
+            return "grand_total"
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by column, keeping grand total and empty rows last."""
+        # Qt passes -1 for "no sort column"
+        if column < 0 or column == self.ACTIONS_COLUMN or not self.kinds:
+            return
+        keys = (self.categories, self.amounts, self.dates, self.descriptions)[column]
+        # The single grand total / empty-state row is tracked, not searched for
+        pinned_row = self.pinned_row
+        movable = [i for i in range(len(self.kinds)) if i != pinned_row]
+        movable.sort(key=keys.__getitem__, reverse=order == Qt.DescendingOrder)
+        if pinned_row >= 0:
+            new_order = movable + [pinned_row]
+            self.pinned_row = len(movable)
+        else:
+            new_order = movable
+
+        self.layoutAboutToBeChanged.emit()
+        for name in self.COLUMNS:
+            values = getattr(self, name)
+            setattr(self, name, [values[i] for i in new_order])
+        new_rows = {old: new for new, old in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[i.row()], i.column()) for i in old_indexes],
+        )
+        self.layoutChanged.emit()
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints Edit/Delete buttons in the Actions column and reports clicks."""
+
+    editClicked = pyqtSignal(int)
+    deleteClicked = pyqtSignal(int)
+
+    BUTTON_HEIGHT = 30
+    BUTTON_MAX_WIDTH = 75
+    CELL_WIDTH = 2 * BUTTON_MAX_WIDTH + 13
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.button_font = QFont("Segoe UI")
+        self.button_font.setPixelSize(10)
+        self.button_font.setBold(True)
+        self.button_text_color = QColor("#0f3460")
+        # Brushes are built once and stretched to each button rect
+        self.edit_brush = self._gradient_brush("#00ffff", "#ff00ff")
+        self.delete_brush = self._gradient_brush("#ff6600", "#e94560")
+
+    @staticmethod
+    def _gradient_brush(start_color, end_color):
+        """Return a horizontal gradient brush relative to the painted shape."""
+        gradient = QLinearGradient(0, 0, 1, 0)
+        gradient.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor(start_color))
+        gradient.setColorAt(1, QColor(end_color))
+        return QBrush(gradient)
+
+    def _button_rects(self, rect):
+        """Return (edit_rect, delete_rect) inside a cell rect."""
+        inner = rect.adjusted(4, 2, -4, -2)
+        width = min(self.BUTTON_MAX_WIDTH, max(0, (inner.width() - 4) // 2))
+        height = min(self.BUTTON_HEIGHT, inner.height())
+        top = inner.top() + (inner.height() - height) // 2
+        edit_rect = QRect(inner.left(), top, width, height)
+        delete_rect = QRect(edit_rect.right() + 5, top, width, height)
+        return edit_rect, delete_rect
+
+    def _paint_button(self, painter, rect, text, brush):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(rect, 6, 6)
+        painter.setPen(self.button_text_color)
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def paint(self, painter, option, index):
+        if index.data(ROW_KIND_ROLE) != ExpenseTableModel.ROW_EXPENSE:
+            super().paint(painter, option, index)
+            return
+        edit_rect, delete_rect = self._button_rects(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.button_font)
+        self._paint_button(painter, edit_rect, "✏️ Edit", self.edit_brush)
+        self._paint_button(painter, delete_rect, "🗑️ Delete", self.delete_brush)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and index.data(ROW_KIND_ROLE) == ExpenseTableModel.ROW_EXPENSE
+        ):
+            edit_rect, delete_rect = self._button_rects(option.rect)
+            if edit_rect.contains(event.pos()):
+                self.editClicked.emit(index.row())
+                return True
+            if delete_rect.contains(event.pos()):
+                self.deleteClicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def sizeHint(self, option, index):
+        return QSize(self.CELL_WIDTH, 50)
+
+
+class BudgetsModel(QAbstractTableModel):
+    """Model behind the budgets table: one (category, budget, spending) row per budget."""
+
+    HEADERS = ["Category", "Budget Limit", "Current Spending", "Actions"]
+
+    OVER_BUDGET_BRUSH = QBrush(OVER_BUDGET_FG)
+    NEAR_BUDGET_BRUSH = QBrush(NEAR_BUDGET_FG)
+    UNDER_BUDGET_BRUSH = QBrush(UNDER_BUDGET_FG)
+
+    # Text alignment per column; the Actions column is painted by a delegate
+    ALIGNMENTS = (
+        int(Qt.AlignLeft | Qt.AlignVCenter),
+        int(Qt.AlignRight | Qt.AlignVCenter),
+        int(Qt.AlignRight | Qt.AlignVCenter),
+        None,
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace the model contents with (category, budget, spending) tuples."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        category, budget, spending = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return category
+            if col == 1:
+                return f"₱{budget:,.2f}"
+            if col == 2:
+                return f"₱{spending:,.2f}"
+            return None
+        if role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[col]
+        if role == Qt.ForegroundRole and col == 2:
+            if spending > budget:
+                return self.OVER_BUDGET_BRUSH
+            if spending > budget * 0.8:
+                return self.NEAR_BUDGET_BRUSH
+            return self.UNDER_BUDGET_BRUSH
+        return None
+
+
+class ReportTableModel(QAbstractTableModel):
+    """Model behind the reports table: one row per filtered expense dict."""
+
+    HEADERS = ["Category", "Amount", "Date", "Description"]
+    KEYS = ("category", "amount", "date", "description")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace the model contents with expense dicts carrying a category key."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        # Cells are formatted only when the view asks for them
+        return str(self._rows[index.row()].get(self.KEYS[index.column()], ""))
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Paints a Remove button in the budgets table and reports the row's category."""
+
+    removeClicked = pyqtSignal(str)
+
+    BUTTON_WIDTH = 71
+    BUTTON_HEIGHT = 24
+    LEFT_MARGIN = 15
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.button_font = QFont("Segoe UI")
+        self.button_font.setPixelSize(11)
+        self.button_font.setBold(True)
+        self.button_brush = QBrush(QColor("#ff4444"))
+        self.hover_brush = QBrush(QColor("#cc0000"))
+        self.text_color = QColor("#ffffff")
+
+    def _button_rect(self, rect):
+        top = rect.top() + (rect.height() - self.BUTTON_HEIGHT) // 2
+        return QRect(
+            rect.left() + self.LEFT_MARGIN, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+
+    def paint(self, painter, option, index):
+        button_rect = self._button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        hovered = option.state & QStyle.State_MouseOver
+        painter.setBrush(self.hover_brush if hovered else self.button_brush)
+        painter.drawRoundedRect(button_rect, 4, 4)
+        painter.setFont(self.button_font)
+        painter.setPen(self.text_color)
+        painter.drawText(button_rect, Qt.AlignCenter, "Remove")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and self._button_rect(option.rect).contains(event.pos())
+        ):
+            category = index.sibling(index.row(), 0).data()
+            if category:
+                self.removeClicked.emit(category)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        # The button cell is never edited
+        return None
+
+
+class BarWidget(QWidget):
+    """Budget progress bar painted directly, instead of styled fill widgets."""
+
+    TRACK_BRUSH = QBrush(QColor("#1a1a2e"))
+    BORDER_COLOR = QColor("#404040")
+    FILL_RED = QBrush(QColor("#ff4444"))  # Bright red for over budget
+    FILL_ORANGE = QBrush(QColor("#ffaa00"))  # Orange for warning
+    FILL_GREEN = QBrush(QColor("#00cc00"))  # Green for good
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.percentage = 0
+        self.fill_brush = self.FILL_GREEN
+        self.setFixedHeight(20)
+
+    def setValue(self, percentage, fill_brush):
+        """Set the filled share (0-100) and its brush, repainting if changed."""
+        if percentage == self.percentage and fill_brush is self.fill_brush:
+            return
+        self.percentage = percentage
+        self.fill_brush = fill_brush
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        track = QRect(0, 0, self.width() - 1, self.height() - 1)
+        painter.setPen(self.BORDER_COLOR)
+        painter.setBrush(self.TRACK_BRUSH)
+        painter.drawRoundedRect(track, 10, 10)
+
+        fill_width = (track.width() - 4) * min(max(self.percentage, 0), 100) // 100
+        if fill_width > 0:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.fill_brush)
+            painter.drawRoundedRect(
+                QRect(track.left() + 2, track.top() + 2, fill_width, track.height() - 3),
+                8,
+                8,
+            )
 
 
 class DashboardWidget(QWidget):
@@ -64,6 +566,10 @@ class DashboardWidget(QWidget):
         self.chart_start_date = None
         self.chart_end_date = None
         self.chart_category_filter = None
+        self._chart_filter_categories = None
+        # Deferred-update bookkeeping for hidden dashboards and sub-tabs
+        self._update_pending = False
+        self._stale_tabs = set()
         self.pie_fig = None
         self.bar_fig = None
         self.total_label = None
@@ -116,8 +622,10 @@ class DashboardWidget(QWidget):
             self.init_summary_tab()
             self.init_charts_tab()
             self.init_trends_tab()
+            self.tabs.currentChanged.connect(self._update_current_tab)
 
             self.update_dashboard()
+            register_dashboard(self)
 
             # Apply cross platform styling
             self.apply_cross_platform_style()
@@ -499,26 +1007,30 @@ class DashboardWidget(QWidget):
         # Sort categories by amount (lowest first)
         category_totals.sort(key=lambda x: x[1], reverse=False)
 
-        # Add sorted categories to table
-        for category, subtotal in category_totals:
-            row = self.summary_table.rowCount()
-            self.summary_table.insertRow(row)
-            self.summary_table.setItem(row, 0, QTableWidgetItem(category))
-            self.summary_table.setItem(
-                row, 1, NumericTableWidgetItem(f"₱{subtotal:,.2f}")
-            )
+        # Size the table once (categories + grand total) and repaint once
+        self.summary_table.setUpdatesEnabled(False)
+        try:
+            self.summary_table.setRowCount(len(category_totals) + 1)
 
-        # Grand total row
-        row = self.summary_table.rowCount()
-        self.summary_table.insertRow(row)
-        grand_item = QTableWidgetItem("🎯 Grand Total")
-        grand_item.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        grand_item.setForeground(QColor("#ffff00"))
-        self.summary_table.setItem(row, 0, grand_item)
-        grand_amt = QTableWidgetItem(f"₱{total_all:,.2f}")
-        grand_amt.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        grand_amt.setForeground(QColor("#ffff00"))
-        self.summary_table.setItem(row, 1, grand_amt)
+            # Add sorted categories to table
+            for row, (category, subtotal) in enumerate(category_totals):
+                self.summary_table.setItem(row, 0, QTableWidgetItem(category))
+                self.summary_table.setItem(
+                    row, 1, NumericTableWidgetItem(f"₱{subtotal:,.2f}", subtotal)
+                )
+
+            # Grand total row
+            row = len(category_totals)
+            grand_item = QTableWidgetItem("🎯 Grand Total")
+            grand_item.setFont(TOTAL_FONT)
+            grand_item.setForeground(HIGHLIGHT_FG)
+            self.summary_table.setItem(row, 0, grand_item)
+            grand_amt = QTableWidgetItem(f"₱{total_all:,.2f}")
+            grand_amt.setFont(TOTAL_FONT)
+            grand_amt.setForeground(HIGHLIGHT_FG)
+            self.summary_table.setItem(row, 1, grand_amt)
+        finally:
+            self.summary_table.setUpdatesEnabled(True)
         self.total_label.setText(f"Grand Total: ₱{total_all:,.2f}")
 
         # Generate and display insights
@@ -622,11 +1134,10 @@ class DashboardWidget(QWidget):
 
             # Budget alerts integration
             if hasattr(self.data_manager, 'budget_manager'):
-                budget_alerts = self.data_manager.budget_manager.check_budget_alerts()
-                if budget_alerts:
-                    budget_warnings = [alert for alert in budget_alerts if "🚨" in alert]
-                    if budget_warnings:
-                        warnings.append(f"{len(budget_warnings)} budget(s) exceeded")
+                budget_alerts = self.data_manager.budget_manager.get_budget_alerts()
+                exceeded = sum(1 for severity, _ in budget_alerts if severity == Severity.CRITICAL)
+                if exceeded:
+                    warnings.append(f"{exceeded} budget(s) exceeded")
 
         except Exception as e:
             logger.warning(f"Error generating insights: {e}")
@@ -688,7 +1199,7 @@ class DashboardWidget(QWidget):
             logger.info("🔄 Updating budget alerts...")
             
             if hasattr(self.data_manager, 'budget_manager'):
-                alerts = self.data_manager.budget_manager.check_budget_alerts()
+                alerts = self.data_manager.budget_manager.get_budget_alerts()
                 budgets_exist = bool(getattr(self.data_manager.budget_manager, 'budgets', {}))
                 
                 logger.info(f"📢 Found {len(alerts)} budget alerts, budgets exist: {budgets_exist}")
@@ -715,14 +1226,15 @@ class DashboardWidget(QWidget):
                     
                 elif alerts:
                     # Real budget alerts exist - show them with proper coloring
-                    alerts_text = "<b>🚨 Budget Alerts:</b><br>"
-                    for alert in alerts:
-                        alerts_text += f"• {alert}<br>"
+                    alerts_text = "<b>🚨 Budget Alerts:</b><br>" + "".join(
+                        f"• {alert}<br>" for _, alert in alerts
+                    )
                     
                     self.budget_alerts_label.setText(alerts_text)
                     
                     # Color coding based on alert severity
-                    if any("🚨" in alert for alert in alerts):
+                    max_severity = max(severity for severity, _ in alerts)
+                    if max_severity == Severity.CRITICAL:
                         # Critical alerts - over budget
                         self.budget_alerts_label.setStyleSheet("""
                             QLabel {
@@ -737,7 +1249,7 @@ class DashboardWidget(QWidget):
                                 line-height: 1.4;
                             }
                         """)
-                    elif any("⚠️" in alert for alert in alerts):
+                    elif max_severity == Severity.WARN:
                         # Warning alerts - approaching budget
                         self.budget_alerts_label.setStyleSheet("""
                             QLabel {
@@ -818,16 +1330,15 @@ class DashboardWidget(QWidget):
                 date_str = expense.get("date", "")
                 if date_str:  # Only process valid dates
                     try:
-                        # Validate the date format
-                        datetime.strptime(date_str, "%Y-%m-%d")
+                        # Validate the date format (memoized per distinct date)
+                        parse_date(date_str)
                         all_dates.append(date_str)
                     except ValueError:
                         continue  # Skip invalid dates
 
         if all_dates:
-            sorted_dates = sorted(all_dates)
-            start_date = QDate.fromString(sorted_dates[0], "yyyy-MM-dd")
-            end_date = QDate.fromString(sorted_dates[-1], "yyyy-MM-dd")
+            start_date = QDate.fromString(min(all_dates), "yyyy-MM-dd")
+            end_date = QDate.fromString(max(all_dates), "yyyy-MM-dd")
         else:
             # Fallback if no data - show last 3 months
             start_date = QDate.currentDate().addMonths(-3)
@@ -924,6 +1435,7 @@ class DashboardWidget(QWidget):
         self.pie_fig.patch.set_facecolor("#2d2d2d")
         self.pie_ax.set_facecolor("#252526")
         self.pie_canvas = FigureCanvas(self.pie_fig)
+        self.pie_canvas.mpl_connect("pick_event", self.on_pie_click)
         charts_layout.addWidget(self.pie_canvas)
 
         # Bar chart
@@ -931,6 +1443,7 @@ class DashboardWidget(QWidget):
         self.bar_fig.patch.set_facecolor("#2d2d2d")
         self.bar_ax.set_facecolor("#252526")
         self.bar_canvas = FigureCanvas(self.bar_fig)
+        self.bar_canvas.mpl_connect("pick_event", self.on_bar_click)
         charts_layout.addWidget(self.bar_canvas)
 
         # Add charts layout to main layout
@@ -988,15 +1501,14 @@ class DashboardWidget(QWidget):
                 date_str = expense.get("date", "")
                 if date_str:
                     try:
-                        datetime.strptime(date_str, "%Y-%m-%d")
+                        parse_date(date_str)
                         all_dates.append(date_str)
                     except ValueError:
                         continue
 
         if all_dates:
-            sorted_dates = sorted(all_dates)
-            start_date = QDate.fromString(sorted_dates[0], "yyyy-MM-dd")
-            end_date = QDate.fromString(sorted_dates[-1], "yyyy-MM-dd")
+            start_date = QDate.fromString(min(all_dates), "yyyy-MM-dd")
+            end_date = QDate.fromString(max(all_dates), "yyyy-MM-dd")
 
             # Update the date widgets
             self.chart_start_date.setDate(start_date)
@@ -1012,6 +1524,14 @@ class DashboardWidget(QWidget):
         # Get filtered data based on date range and category
         filtered_data = self.get_filtered_chart_data()
         categories, amounts = aggregate_category_totals(filtered_data)
+        # Sort once by amount (desc); the pie's top-N grouping and the bar
+        # chart both use this order, and re-sorting sorted input is linear
+        if amounts:
+            cats_sorted, amts_sorted = zip(
+                *sorted(zip(categories, amounts), key=itemgetter(1), reverse=True)
+            )
+        else:
+            cats_sorted, amts_sorted = (), ()
 
         # Professional color palette
         colors = [
@@ -1035,10 +1555,9 @@ class DashboardWidget(QWidget):
         # Update Pie Chart
         self.pie_ax.clear()
         if amounts:
-            top_categories, top_amounts = prepare_chart_data(categories, amounts)
-            explode = [
-                0.05 if a < (sum(top_amounts) * 0.01) else 0 for a in top_amounts
-            ]
+            top_categories, top_amounts = prepare_chart_data(cats_sorted, amts_sorted)
+            explode_below = sum(top_amounts) * 0.01
+            explode = [0.05 if a < explode_below else 0 for a in top_amounts]
 
             wedges, texts, autotexts = self.pie_ax.pie(
                 top_amounts,
@@ -1052,7 +1571,6 @@ class DashboardWidget(QWidget):
             # Make pie chart interactive too
             for wedge in wedges:
                 wedge.set_picker(True)
-            self.pie_canvas.mpl_connect("pick_event", self.on_pie_click)
 
             # Set text colors for better contrast
             for text in texts:
@@ -1069,16 +1587,13 @@ class DashboardWidget(QWidget):
             )
             self.pie_ax.axis("equal")
 
-        self.pie_canvas.draw()
+        self.pie_canvas.draw_idle()
 
         # Update Bar Chart
         self.bar_ax.clear()
         if amounts:
-            sorted_data = sorted(
-                zip(categories, amounts), key=lambda x: x[1], reverse=True
-            )
-            if sorted_data:
-                cats, amts = zip(*sorted_data)
+            if cats_sorted:
+                cats, amts = cats_sorted, amts_sorted
 
                 bars = self.bar_ax.bar(cats, amts, color=colors[: len(cats)])
 
@@ -1088,8 +1603,6 @@ class DashboardWidget(QWidget):
                     self.bar_references[bar] = cat
                     bar.set_picker(True)
 
-                self.bar_canvas.mpl_connect("pick_event", self.on_bar_click)
-
                 # Set professional styling
                 self.bar_ax.set_ylabel(
                     "Amount (₱)", color="#e0e0e0", fontweight="bold", fontsize=12
@@ -1117,6 +1630,7 @@ class DashboardWidget(QWidget):
                 self.bar_ax.grid(True, alpha=0.2, color="#404040", linestyle="--")
 
                 # Add value labels on bars with contrast
+                label_offset = max(amts) * 0.01
                 for bar in bars:
                     height = bar.get_height()
                     text_color = (
@@ -1124,7 +1638,7 @@ class DashboardWidget(QWidget):
                     )
                     self.bar_ax.text(
                         bar.get_x() + bar.get_width() / 2.0,
-                        height + max(amts) * 0.01,
+                        height + label_offset,
                         f"₱{height:.0f}",
                         ha="center",
                         va="bottom",
@@ -1145,7 +1659,7 @@ class DashboardWidget(QWidget):
                     fontsize=12,
                 )
 
-        self.bar_canvas.draw()
+        self.bar_canvas.draw_idle()
 
     def on_pie_click(self, event):
         """Handle pie chart clicks to show category details"""
@@ -1713,42 +2227,50 @@ class DashboardWidget(QWidget):
 
     def get_filtered_chart_data(self):
         """Get data filtered by date range and category for charts"""
-        if not hasattr(self, "chart_start_date") or not self.chart_start_date:
+        if (
+            getattr(self, "chart_start_date", None) is None
+            or getattr(self, "chart_end_date", None) is None
+            or getattr(self, "chart_category_filter", None) is None
+        ):
             # Return all data if date filters aren't set up yet
             return self.data_manager.expenses
 
-        try:
-            start_date = self.chart_start_date.date().toPyDate()
-            end_date = self.chart_end_date.date().toPyDate()
-            category_filter = self.chart_category_filter.currentText()
+        start = self.chart_start_date.date().toPyDate()
+        end = self.chart_end_date.date().toPyDate()
+        # Canonical ISO dates compare correctly as strings, so out-of-range
+        # ones are rejected without parsing
+        start_date = start.isoformat()
+        end_date = end.isoformat()
+        category_filter = self.chart_category_filter.currentText()
+        all_categories = category_filter == "All Categories"
 
-            filtered_data = {}
+        filtered_data = {}
 
-            for category, expenses in self.data_manager.expenses.items():
-                filtered_expenses = []
-                for expense in expenses:
-                    try:
-                        expense_date = datetime.strptime(
-                            expense.get("date", ""), "%Y-%m-%d"
-                        ).date()
-                        date_match = start_date <= expense_date <= end_date
-                        category_match = (
-                            category_filter == "All Categories"
-                            or category == category_filter
-                        )
-
-                        if date_match and category_match:
-                            filtered_expenses.append(expense)
-                    except ValueError:
-                        continue
+        for category, expenses in self.data_manager.expenses.items():
+            if not all_categories and category != category_filter:
+                continue
+
+            filtered_expenses = []
+            for expense in expenses:
+                date = expense.get("date", "")
+                # Skip missing or non-string dates rather than comparing them
+                if not isinstance(date, str):
+                    continue
+                if ISO_DATE_RE.match(date) and not start_date <= date <= end_date:
+                    continue
+                # parse_date is memoized; it also accepts unpadded dates such
+                # as "2023-9-15" and rejects impossible ones like "2023-02-30"
+                try:
+                    expense_date = parse_date(date).date()
+                except ValueError:
+                    continue
+                if start <= expense_date <= end:
+                    filtered_expenses.append(expense)
 
-                if filtered_expenses:
-                    filtered_data[category] = filtered_expenses
+            if filtered_expenses:
+                filtered_data[category] = filtered_expenses
 
-            return filtered_data
-        except Exception:
-            # Fallback to all data if there's any error
-            return self.data_manager.expenses
+        return filtered_data
 
     # Trends
 
@@ -1765,81 +2287,84 @@ class DashboardWidget(QWidget):
         self.trend_canvas = FigureCanvas(self.trend_fig)
         layout.addWidget(self.trend_canvas)
 
+        # The axes, their styling and the line persist across updates;
+        # update_trends_tab only swaps in new data
+        self.trend_ax.set_title(
+            "Expense Trend Over Time",
+            color="#e0e0e0",
+            fontsize=14,
+            fontweight="bold",
+            pad=20,
+        )
+        self.trend_ax.set_xlabel("Month", color="#e0e0e0", fontweight="bold", fontsize=12)
+        self.trend_ax.set_ylabel(
+            "Total Expenses (₱)", color="#e0e0e0", fontweight="bold", fontsize=12
+        )
+        self.trend_ax.tick_params(axis="x", rotation=45, colors="#e0e0e0", labelsize=10)
+        self.trend_ax.tick_params(axis="y", colors="#e0e0e0", labelsize=10)
+        self.trend_ax.spines["bottom"].set_color("#404040")
+        self.trend_ax.spines["left"].set_color("#404040")
+        self.trend_ax.spines["top"].set_visible(False)
+        self.trend_ax.spines["right"].set_visible(False)
+        self.trend_ax.grid(True, alpha=0.2, color="#404040", linestyle="--")
+
+        (self.trend_line,) = self.trend_ax.plot(
+            [],
+            [],
+            marker="o",
+            color="#4e79a7",
+            linewidth=2.5,
+            markersize=6,
+            markerfacecolor="#ffffff",
+            markeredgecolor="#4e79a7",
+            markeredgewidth=1,
+        )
+        self.trend_max_annotation = None
+
     def update_trends_tab(self):
         months, totals = prepare_trend_data(self.data_manager.get_monthly_totals())
 
-        self.trend_ax.clear()
-        if months:
-            # Professional line plot
-            self.trend_ax.plot(
-                months,
-                totals,
-                marker="o",
-                color="#4e79a7",
-                linewidth=2.5,
-                markersize=6,
-                markerfacecolor="#ffffff",
-                markeredgecolor="#4e79a7",
-                markeredgewidth=1,
-            )
+        # Months sit at 0..n-1 with their names as tick labels
+        positions = list(range(len(months)))
+        self.trend_line.set_data(positions, totals)
+        self.trend_ax.set_xticks(positions)
+        self.trend_ax.set_xticklabels(months)
 
-            # Professional titles and labels
-            self.trend_ax.set_title(
-                "Expense Trend Over Time",
-                color="#e0e0e0",
-                fontsize=14,
+        if self.trend_max_annotation is not None:
+            self.trend_max_annotation.remove()
+            self.trend_max_annotation = None
+        if months:
+            # Highlight maximum point
+            max_idx = totals.index(max(totals))
+            self.trend_max_annotation = self.trend_ax.annotate(
+                f"₱{totals[max_idx]:.0f}",
+                xy=(max_idx, totals[max_idx]),
+                xytext=(10, 10),
+                textcoords="offset points",
+                bbox=dict(boxstyle="round,pad=0.3", facecolor="#e15759", alpha=0.8),
+                arrowprops=dict(arrowstyle="->", color="white"),
+                fontsize=9,
                 fontweight="bold",
-                pad=20,
-            )
-            self.trend_ax.set_xlabel(
-                "Month", color="#e0e0e0", fontweight="bold", fontsize=12
+                color="white",
             )
-            self.trend_ax.set_ylabel(
-                "Total Expenses (₱)", color="#e0e0e0", fontweight="bold", fontsize=12
-            )
-
-            # Professional tick styling
-            self.trend_ax.tick_params(
-                axis="x", rotation=45, colors="#e0e0e0", labelsize=10
-            )
-            self.trend_ax.tick_params(axis="y", colors="#e0e0e0", labelsize=10)
-
-            # Professional axis styling
-            self.trend_ax.spines["bottom"].set_color("#404040")
-            self.trend_ax.spines["left"].set_color("#404040")
-            self.trend_ax.spines["top"].set_visible(False)
-            self.trend_ax.spines["right"].set_visible(False)
-
-            # Professional grid
-            self.trend_ax.grid(True, alpha=0.2, color="#404040", linestyle="--")
-
-            # Add value annotations for important points
-            if len(totals) > 0:
-                max_idx = totals.index(max(totals))
-                min_idx = totals.index(min(totals))
-
-                # Highlight maximum point
-                self.trend_ax.annotate(
-                    f"₱{totals[max_idx]:.0f}",
-                    xy=(months[max_idx], totals[max_idx]),
-                    xytext=(10, 10),
-                    textcoords="offset points",
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="#e15759", alpha=0.8),
-                    arrowprops=dict(arrowstyle="->", color="white"),
-                    fontsize=9,
-                    fontweight="bold",
-                    color="white",
-                )
 
-        self.trend_canvas.draw()
+        self.trend_ax.relim()
+        self.trend_ax.autoscale_view()
+        self.trend_canvas.draw_idle()
         logger.debug("Updated trends chart with %d months of data", len(months))
 
     def update_chart_filters(self):
         """Update chart filter dropdowns with current categories"""
+        categories = self.data_manager.get_all_categories()
+        # Skip the Qt round trips when the category list has not changed
+        if categories == self._chart_filter_categories:
+            return
+        self._chart_filter_categories = categories
+
         current_categories = self.chart_category_filter.currentText()
         self.chart_category_filter.clear()
         self.chart_category_filter.addItem("All Categories")
-        self.chart_category_filter.addItems(self.data_manager.get_all_categories())
+        self.chart_category_filter.addItems(categories)
 
         # Restore previous selection if possible
         index = self.chart_category_filter.findText(current_categories)
@@ -1849,9 +2374,16 @@ class DashboardWidget(QWidget):
     def update_dashboard(self):
         """Update all dashboard components - FORCE budget alerts update."""
         try:
-            self.update_summary_tab()
-            self.update_charts_tab()
-            self.update_trends_tab()
+            # Sub-tabs are only redrawn when seen: the current one now if the
+            # dashboard is on screen, otherwise once it is shown
+            self._stale_tabs = {self.summary_tab, self.charts_tab, self.trends_tab}
+            if self.isVisible():
+                self._update_pending = False
+                self._update_current_tab()
+            else:
+                self._update_pending = True
+
+            # Filters, date ranges and alerts are cheap; keep them current
             self.update_chart_filters()
             self.update_chart_date_ranges()
             
@@ -1863,6 +2395,31 @@ class DashboardWidget(QWidget):
         except Exception as e:
             logger.error(f"❌ Error updating dashboard: {e}")
 
+    def _update_current_tab(self, index=None):
+        """Redraw the current sub-tab if data changed since it was last drawn."""
+        current = self.tabs.currentWidget()
+        if current not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(current)
+        if current is self.summary_tab:
+            self.update_summary_tab()
+        elif current is self.charts_tab:
+            self.update_charts_tab()
+        elif current is self.trends_tab:
+            self.update_trends_tab()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._update_pending:
+            # Deferred so an explicit update_dashboard() from the tab switch
+            # handler, which clears the flag, doesn't redraw twice
+            QTimer.singleShot(0, self._flush_pending_update)
+
+    def _flush_pending_update(self):
+        if self._update_pending:
+            self._update_pending = False
+            self._update_current_tab()
+
     def force_budget_alerts_update(self):
         """Force update budget alerts with proper no-budgets handling"""
         try:
@@ -1898,9 +2455,9 @@ class DashboardWidget(QWidget):
                     """)
                 elif alerts:
                     # Real alerts exist
-                    alerts_text = "<b>🚨 Budget Alerts:</b><br>"
-                    for alert in alerts:
-                        alerts_text += f"• {alert}<br>"
+                    alerts_text = "<b>🚨 Budget Alerts:</b><br>" + "".join(
+                        f"• {alert}<br>" for alert in alerts
+                    )
                     
                     self.budget_alerts_label.setText(alerts_text)
                     self.budget_alerts_label.setStyleSheet("""
@@ -1942,6 +2499,11 @@ class DashboardWidget(QWidget):
 
 
 class ExpenseTracker(QWidget):
+    # Result list currently rendered by search_expenses, if any
+    _shown_search_results = None
+    # (row, column, width) of the span pin_grand_total_row last applied
+    _applied_span = None
+
     def __init__(self, data_manager=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.data_manager = data_manager or DataManager()
@@ -1955,10 +2517,17 @@ class ExpenseTracker(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(
-            ["Category", "Amount", "Date", "Description", "Actions"]
+        self.table = QTableView()
+        self.model = ExpenseTableModel(self)
+        self.table.setModel(self.model)
+        self.action_delegate = ActionButtonDelegate(self.table)
+        self.table.setItemDelegateForColumn(
+            ExpenseTableModel.ACTIONS_COLUMN, self.action_delegate
         )
+        self.action_delegate.editClicked.connect(self.on_edit_clicked)
+        self.action_delegate.deleteClicked.connect(self.on_delete_clicked)
+        self.model.modelReset.connect(self.pin_grand_total_row)
+        self.model.layoutChanged.connect(self.pin_grand_total_row)
         self.table.setSortingEnabled(True)
 
         # HEADER
@@ -1985,7 +2554,7 @@ class ExpenseTracker(QWidget):
         # Professional table styling
         self.table.setStyleSheet(
             """
-            QTableWidget {
+            QTableView {
                 background-color: #252526;
                 color: #e0e0e0;
                 gridline-color: #404040;
@@ -1995,14 +2564,12 @@ class ExpenseTracker(QWidget):
                 font-size: 12px;
             }
             
-            QTableWidget::item {
-                background-color: #252526;
-                color: #e0e0e0;
+            QTableView::item {
                 padding: 8px 12px;
                 border-bottom: 1px solid #404040;
             }
             
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #007acc;
                 color: #ffffff;
             }
@@ -2034,6 +2601,8 @@ class ExpenseTracker(QWidget):
 
         self.table.setShowGrid(True)
         self.table.verticalHeader().setVisible(True)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(50)
 
         # Set better column resize policies
         self.table.horizontalHeader().setSectionResizeMode(
@@ -2046,12 +2615,11 @@ class ExpenseTracker(QWidget):
             2, QHeaderView.ResizeToContents
         )
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.ResizeToContents
-        )
+        # The actions column never changes width, so don't measure it per row
+        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)
+        self.table.horizontalHeader().resizeSection(4, ActionButtonDelegate.CELL_WIDTH)
 
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.horizontalHeader().sectionClicked.connect(self.on_table_sorted)
 
         # Neon accent buttons
         buttons_data = [
@@ -2188,7 +2756,7 @@ class ExpenseTracker(QWidget):
         layout.addWidget(self.table)
 
         # Neon summary label
-        self.summary_label = QLabel("Total: ₱0.00")
+        self.summary_label = QLabel(TOTAL_LABEL_FORMAT(0))
         self.summary_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         self.summary_label.setStyleSheet(
             """
@@ -2253,8 +2821,6 @@ class ExpenseTracker(QWidget):
         return f"#{r:02x}{g:02x}{b:02x}"
 
     def go_to_dashboard(self):
-        from PyQt5.QtWidgets import QApplication
-
         for w in QApplication.topLevelWidgets():
             if hasattr(w, "tabs") and hasattr(w, "dashboard_tab"):
                 try:
@@ -2370,7 +2936,10 @@ class ExpenseTracker(QWidget):
         logger.debug(
             "Search executed for keyword='%s', %d results found", keyword, len(results)
         )
+        if results is self._shown_search_results:
+            return  # The table already shows exactly these rows
         self.render_table(results, is_search=True)
+        self._shown_search_results = results
 
     def show_expense(self):
         expenses = self.data_manager.get_sorted_expenses()
@@ -2389,7 +2958,7 @@ class ExpenseTracker(QWidget):
                 self, "No Data", "There are no expenses to display."
             )
         self.render_table(expenses)
-        self.table.sortItems(2)
+        self.table.sortByColumn(2, Qt.AscendingOrder)
 
     def safe_show_expense(self):
         """Safe version of show_expense for tests"""
@@ -2403,160 +2972,87 @@ class ExpenseTracker(QWidget):
                 raise
 
     def show_total_expense(self):
-        subtotals = self.data_manager.get_category_subtotals()
-        self.render_table(self.data_manager.get_sorted_expenses(), show_totals=True)
-        self.table.sortItems(1, Qt.AscendingOrder)
-        self.pin_grand_total_row()
-        logger.debug("Displayed totals for %d categories", len(subtotals))
+        expenses = self.data_manager.get_sorted_expenses()
+        self.render_table(expenses, show_totals=True)
+        self.table.sortByColumn(1, Qt.AscendingOrder)
+        logger.debug("Displayed totals for %d categories", len(expenses))
 
     def render_table(self, data, show_totals=False, is_search=False):
         """Renders the table."""
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-        total_all = 0.0
-
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["Category", "Amount", "Date", "Description", "Actions"]
-        )
-
-        def add_action_row(row_data, record):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            formatted = format_expense_row(category, record)
-
-            self.table.setItem(row, 0, QTableWidgetItem(formatted["category"]))
-            self.table.setItem(row, 1, NumericTableWidgetItem(formatted["amount"]))
-            self.table.setItem(row, 2, QTableWidgetItem(formatted["date"]))
-            self.table.setItem(row, 3, QTableWidgetItem(formatted["description"]))
-
-            action_widget = QWidget()
-            layout = QHBoxLayout(action_widget)
-            layout.setContentsMargins(4, 2, 4, 2)
-            layout.setSpacing(4)
-
-            edit_btn = QPushButton("✏️ Edit")
-            delete_btn = QPushButton("🗑️ Delete")
-
-            action_button_style = """
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #00ffff, stop:1 #ff00ff);
-                    color: #0f3460;
-                    border: none;
-                    padding: 8px 12px;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    font-family: "Segoe UI";
-                    font-size: 10px;
-                    min-width: 65px;
-                    max-width: 75px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #ff00ff, stop:1 #ffff00);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #ffff00, stop:1 #00ffff);
-                }
-                QPushButton[text*="Delete"] {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #ff6600, stop:1 #e94560);
-                }
-                QPushButton[text*="Delete"]:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #e94560, stop:1 #ff3399);
-                }
-            """
+        self._shown_search_results = None
+        if not data and not show_totals:
+            self._show_rows([ExpenseTableModel.EMPTY_ROW])
+            self.summary_label.setText(TOTAL_LABEL_FORMAT(0))
+            return
 
-            edit_btn.setStyleSheet(action_button_style)
-            delete_btn.setStyleSheet(action_button_style)
+        rows = []
+        total_all = 0.0
 
-            edit_btn.clicked.connect(
-                lambda _, c=category, r=record: self.edit_expense(c, r)
-            )
-            delete_btn.clicked.connect(
-                lambda _, c=category, r=record: self.delete_expense(c, r)
+        if show_totals:
+            expenses = getattr(self.data_manager, "expenses", None)
+            if isinstance(expenses, dict) and data.keys() == expenses.keys():
+                subtotals = self.data_manager.get_category_subtotals()
+                total_all = math.fsum(subtotals.values())
+            else:
+                subtotals, total_all = compute_totals(data)
+            for category, subtotal in subtotals.items():
+                rows.append(ExpenseTableModel.total_row(category, subtotal))
+            rows.append(
+                ExpenseTableModel.total_row("🎯 Grand Total", total_all, is_grand=True)
             )
 
-            layout.addWidget(edit_btn)
-            layout.addWidget(delete_btn)
-            action_widget.setLayout(layout)
-
-            self.table.setCellWidget(row, 4, action_widget)
-            self.table.setRowHeight(row, 50)
-
-        def add_total_row(category_name, subtotal, is_grand=False):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        elif is_search:
+            expense_row = ExpenseTableModel.expense_row
+            rows = [expense_row(category, record) for category, record in data]
+            # Amounts were already coerced to float by expense_row
+            total_all = sum(row[2] for row in rows)
 
-            formatted = format_total_row(category_name, subtotal, is_grand)
+        else:
+            expenses = getattr(self.data_manager, "expenses", None)
+            if isinstance(expenses, dict) and data.keys() == expenses.keys():
+                categories = self.data_manager.get_sorted_categories()
+            else:
+                categories = sorted(data)
+            expense_row = ExpenseTableModel.expense_row
+            rows = [
+                expense_row(category, record)
+                for category in categories
+                for record in data.get(category, [])
+            ]
+            total_all = sum(row[2] for row in rows)
 
-            item_cat = QTableWidgetItem(formatted["category"])
-            item_amt = NumericTableWidgetItem(formatted["amount"])
-            item_desc = QTableWidgetItem(formatted["description"])
-            item_action = QTableWidgetItem("")
+        # Categories present but without records
+        if not rows:
+            rows.append(ExpenseTableModel.EMPTY_ROW)
 
-            font = (
-                QFont("Segoe UI", 12, QFont.Bold)
-                if is_grand
-                else QFont("Segoe UI", 11, QFont.Bold)
-            )
-            bg_color = QColor("#ffff00") if is_grand else QColor("#00ffff")
-            text_color = QColor("#0f3460") if is_grand else QColor("#0f3460")
-
-            for item in [item_cat, item_amt, item_desc, item_action]:
-                item.setFont(font)
-                item.setBackground(bg_color)
-                item.setForeground(text_color)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-            self.table.setItem(row, 0, item_cat)
-            self.table.setItem(row, 1, item_amt)
-            self.table.setItem(row, 2, QTableWidgetItem(""))
-            self.table.setItem(row, 3, QTableWidgetItem(""))
-            self.table.setItem(row, 4, QTableWidgetItem(""))
-
-            if is_grand:
-                item_cat.setData(Qt.UserRole, "grand_total")
-                item_amt.setData(Qt.UserRole, "grand_total")
-                self.table.setSpan(row, 2, 1, 3)
+        self._show_rows(rows)
+        self.summary_label.setText(TOTAL_LABEL_FORMAT(total_all))
 
-        if show_totals:
-            for category in data.keys():
-                subtotal = calculate_subtotal(data.get(category, []))
-                add_total_row(category, subtotal)
-                total_all += subtotal
-            add_total_row("🎯 Grand Total", total_all, is_grand=True)
+    def _show_rows(self, rows):
+        """Load rows into the model, re-sort and re-span with one repaint."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(rows)
+            header = self.table.horizontalHeader()
+            if (
+                len(rows) > 1
+                and header.sortIndicatorSection() != ExpenseTableModel.ACTIONS_COLUMN
+            ):
+                self.model.sort(
+                    header.sortIndicatorSection(), header.sortIndicatorOrder()
+                )
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-        elif is_search:
-            for category, record in data:
-                row_data = format_expense_row(category, record)
-                add_action_row(row_data, record)
-                total_all += float(record.get("amount", 0.0) or 0.0)
+    def on_edit_clicked(self, row):
+        entry = self.model.record_at(row)
+        if entry is not None:
+            self.edit_expense(*entry)
 
-        else:
-            for category in sorted(data.keys()):
-                for record in data.get(category, []):
-                    row_data = format_expense_row(category, record)
-                    add_action_row(row_data, record)
-                    total_all += float(record.get("amount", 0.0) or 0.0)
-
-        # Handle empty state
-        if self.table.rowCount() == 0:
-            self.table.insertRow(0)
-            empty_item = QTableWidgetItem("📊 No data available")
-            empty_item.setFont(QFont("Segoe UI", 12, QFont.Bold))
-            empty_item.setForeground(QColor("#ffff00"))
-            self.table.setItem(0, 0, empty_item)
-            self.table.setSpan(0, 0, 1, self.table.columnCount())
-
-        self.summary_label.setText(f"Total: ₱{total_all:,.2f}")
-        self.table.setSortingEnabled(True)
-        if show_totals:
-            self.pin_grand_total_row()
+    def on_delete_clicked(self, row):
+        entry = self.model.record_at(row)
+        if entry is not None:
+            self.delete_expense(*entry)
 
     def open_budget_dialog(self):
         """Open budget management dialog from Expenses tab button."""
@@ -2569,23 +3065,30 @@ class ExpenseTracker(QWidget):
             QMessageBox.warning(self, "Error", "Could not open budget dialog.")
     
     def refresh_category_dropdowns(self):
-        for widget in __import__(
-            "PyQt5.QtWidgets", fromlist=["QApplication"]
-        ).QApplication.topLevelWidgets():
-            for dlg in widget.findChildren(AddExpenseDialog):
-                dlg.category_dropdown.clear()
-                dlg.category_dropdown.addItems(self.data_manager.categories)
+        categories = tuple(self.data_manager.categories)
+        for dlg in open_add_expense_dialogs():
+            if dlg.dropdown_categories == categories:
+                continue
+            try:
+                dropdown = dlg.category_dropdown
+                selected = dropdown.currentText()
+                # Rebuild silently, then put the user's choice back if it survived
+                dropdown.blockSignals(True)
+                try:
+                    dropdown.clear()
+                    dropdown.addItems(categories)
+                    index = dropdown.findText(selected)
+                    if index >= 0:
+                        dropdown.setCurrentIndex(index)
+                finally:
+                    dropdown.blockSignals(False)
+                dlg.dropdown_categories = categories
+            except RuntimeError:
+                # Dialog already closed and deleted
+                pass
 
     def _refresh_dashboards(self):
-        from PyQt5.QtWidgets import QApplication, QWidget
-
-        for w in QApplication.topLevelWidgets():
-            for child in w.findChildren(QWidget):
-                if hasattr(child, "update_dashboard"):
-                    try:
-                        child.update_dashboard()
-                    except Exception:
-                        pass
+        refresh_dashboards()
 
     def clear_search(self):
         self.search_input.clear()
@@ -2611,7 +3114,7 @@ class ExpenseTracker(QWidget):
 
     def update_summary_label(self):
         total_all = self.data_manager.get_grand_total()
-        self.summary_label.setText(f"Total: ₱{total_all:,.2f}")
+        self.summary_label.setText(TOTAL_LABEL_FORMAT(total_all))
 
     def fade_label(self, fade_out_duration=600, fade_in_duration=500):
         effect = QGraphicsOpacityEffect(self.summary_label)
@@ -2651,47 +3154,30 @@ class ExpenseTracker(QWidget):
         fade_out.start()
         self._fade_out = fade_out
 
-    def on_table_sorted(self, idx):
-        self.pin_grand_total_row()
-
     def pin_grand_total_row(self):
-        rows = self.table.rowCount()
-        grand_rows = [
-            r
-            for r in range(rows)
-            if self.table.item(r, 0)
-            and self.table.item(r, 0).data(Qt.UserRole) == "grand_total"
-        ]
-        if not grand_rows:
-            return
-        grand_row = grand_rows[0]
-        if grand_row != rows - 1:
-            items = [
-                self.table.takeItem(grand_row, c)
-                for c in range(self.table.columnCount())
-            ]
-            widgets = [
-                self.table.cellWidget(grand_row, c)
-                for c in range(self.table.columnCount())
-            ]
-            self.table.removeRow(grand_row)
-            new_row = self.table.rowCount()
-            self.table.insertRow(new_row)
-            for c, it in enumerate(items):
-                if it is not None:
-                    self.table.setItem(new_row, c, it)
-                w = widgets[c]
-                if w is not None:
-                    self.table.setCellWidget(new_row, c, w)
-            try:
-                self.table.setSpan(new_row, 2, 1, 3)
-            except Exception:
-                pass
+        """Re-apply the spans for the grand total and empty-state rows.
+
+        The model already keeps those rows last when sorting and tracks
+        their position, so only the view spans need to follow them.
+        Connected to the model's reset and layout signals.
+        """
+        row = self.model.pinned_row
+        if row < 0:
+            span = None
+        elif self.model.kinds[row] == ExpenseTableModel.ROW_GRAND_TOTAL:
+            span = (row, 2, 3)
         else:
-            try:
-                self.table.setSpan(grand_row, 2, 1, 3)
-            except Exception:
-                pass
+            span = (row, 0, self.model.columnCount())
+        # View spans survive model resets and sorts, so an unchanged span
+        # (the common case on a header click) needs no Qt calls at all
+        if span == self._applied_span:
+            return
+
+        self.table.clearSpans()
+        if span is not None:
+            row, column, width = span
+            self.table.setSpan(row, column, 1, width)
+        self._applied_span = span
 
     def exit_mode(self):
         from PyQt5.QtWidgets import QMessageBox
@@ -2707,7 +3193,136 @@ class ExpenseTracker(QWidget):
             QMessageBox.information(
                 self, "Save successful", "Thank you for using Expense Tracker."
             )
-            __import__("PyQt5.QtWidgets", fromlist=["QApplication"]).QApplication.quit()
+            QApplication.quit()
+
+# Budget view stylesheets, shared by every refresh rather than rebuilt per widget
+QSS_ALERT_HEADER_NEUTRAL = """
+    QLabel {
+        color: #b0b0b0;  /* Neutral gray */
+        font-weight: bold;
+        font-size: 14px;
+        padding: 8px;
+        background: #2d2d2d;
+        border-radius: 6px;
+        border: 1px solid #404040;  /* Neutral border */
+    }
+"""
+QSS_ALERT_HEADER_CRITICAL = """
+    QLabel {
+        color: #ff6b6b;  /* Red text */
+        font-weight: bold;
+        font-size: 14px;
+        padding: 8px;
+        background: #442222;  /* Dark red background */
+        border-radius: 6px;
+        border: 1px solid #ff4444;  /* Red border */
+    }
+"""
+QSS_ALERT_HEADER_WARN = """
+    QLabel {
+        color: #ffb86c;  /* Orange text */
+        font-weight: bold;
+        font-size: 14px;
+        padding: 8px;
+        background: #443322;  /* Dark orange background */
+        border-radius: 6px;
+        border: 1px solid #ffa500;  /* Orange border */
+    }
+"""
+QSS_ALERT_HEADER_GOOD = """
+    QLabel {
+        color: #6bff6b;  /* Green text */
+        font-weight: bold;
+        font-size: 14px;
+        padding: 8px;
+        background: #224422;  /* Dark green background */
+        border-radius: 6px;
+        border: 1px solid #00ff00;  /* Green border */
+    }
+"""
+QSS_ALERTS_TEXT_MUTED = """
+    QTextEdit {
+        background-color: #2d2d2d;
+        color: #b0b0b0;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 12px;
+        font-family: "Segoe UI";
+        font-size: 12px;
+        line-height: 1.4;
+    }
+"""
+QSS_ALERTS_TEXT = """
+    QTextEdit {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 12px;
+        font-family: "Segoe UI";
+        font-size: 12px;
+        line-height: 1.4;
+    }
+"""
+QSS_NO_BUDGETS_LABEL = """
+    QLabel {
+        color: #b0b0b0; 
+        font-size: 14px;
+        font-style: italic; 
+        padding: 40px;
+        background: #2d2d2d;
+        border: 2px dashed #404040;
+        border-radius: 12px;
+        text-align: center;
+        line-height: 1.6;
+    }
+"""
+QSS_BAR_CONTAINER = """
+    QWidget {
+        background: #2d2d2d;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        margin: 2px;
+    }
+"""
+QSS_BAR_CATEGORY = """
+    QLabel {
+        color: #e0e0e0; 
+        font-weight: bold; 
+        font-size: 13px;
+        padding: 2px 0px;
+    }
+"""
+QSS_BAR_AMOUNTS = """
+    QLabel {
+        color: #b0b0b0; 
+        font-size: 11px;
+        font-weight: bold;
+        padding: 2px 0px;
+    }
+"""
+
+_QSS_PCT_TEMPLATE = """
+    QLabel {{
+        color: {}; 
+        font-weight: bold; 
+        font-size: 11px;
+        padding: 1px 0px;
+    }}
+"""
+QSS_PCT_RED = _QSS_PCT_TEMPLATE.format(OVER_BUDGET_FG.name())
+QSS_PCT_ORANGE = _QSS_PCT_TEMPLATE.format(NEAR_BUDGET_FG.name())
+QSS_PCT_GREEN = _QSS_PCT_TEMPLATE.format(UNDER_BUDGET_FG.name())
+
+
+@dataclass
+class BudgetsViewState:
+    """Everything one BudgetDialog refresh displays, computed in a single pass."""
+
+    rows: list = field(default_factory=list)  # (category, budget, spending)
+    over: int = 0
+    alerts: list = field(default_factory=list)  # (Severity, message)
+
 
 class BudgetDialog(QDialog):
     def __init__(self, data_manager, parent=None):
@@ -2717,6 +3332,8 @@ class BudgetDialog(QDialog):
         self.setModal(True)
         self.setMinimumSize(700, 600)
         self.resize(750, 650)  # Larger for tabbed interface
+        # Set while a coalesced refresh is queued for the next event-loop tick
+        self._refresh_pending = False
         
         self.initUI()
         
@@ -2973,19 +3590,22 @@ class BudgetDialog(QDialog):
         layout.addWidget(header_label)
         
         # Budgets table
-        self.budgets_table = QTableWidget()
-        self.budgets_table.setColumnCount(4)
-        self.budgets_table.setHorizontalHeaderLabels(["Category", "Budget Limit", "Current Spending", "Actions"])
-        # === AUTO-ADJUST COLUMNS PROPERLY ===
+        self.budgets_table = QTableView()
+        self.budgets_model = BudgetsModel(self)
+        self.budgets_table.setModel(self.budgets_model)
+        # Fixed starting widths; ResizeToContents would measure every cell per refresh
         header = self.budgets_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Category - fit content
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Budget Limit - fit content  
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Current Spending - fit content
-        header.setSectionResizeMode(3, QHeaderView.Stretch)           # Actions - stretch to fill space
+        header.setSectionResizeMode(0, QHeaderView.Interactive)  # Category
+        header.setSectionResizeMode(1, QHeaderView.Interactive)  # Budget Limit
+        header.setSectionResizeMode(2, QHeaderView.Interactive)  # Current Spending
+        header.setSectionResizeMode(3, QHeaderView.Stretch)      # Actions - stretch to fill space
+        header.resizeSection(0, 180)
+        header.resizeSection(1, 140)
+        header.resizeSection(2, 160)
         
         # Table styling
         self.budgets_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
             background-color: #252526;
             color: #e0e0e0;
             gridline-color: #404040;
@@ -2995,7 +3615,7 @@ class BudgetDialog(QDialog):
             font-size: 13px;
             alternate-background-color: #2d2d2d;
         }
-        QTableWidget::item {
+        QTableView::item {
             background-color: #252526;
             color: #e0e0e0;
             padding: 8px 13px;
@@ -3012,24 +3632,24 @@ class BudgetDialog(QDialog):
             font-family: "Segoe UI";
             font-size: 12px;
         }
-        QTableWidget QScrollBar:vertical {
+        QTableView QScrollBar:vertical {
             background: #2d2d2d;
             width: 15px;
         }
-        QTableWidget QScrollBar::handle:vertical {
+        QTableView QScrollBar::handle:vertical {
             background: #007acc;
             border-radius: 7px;
             min-height: 25px;
             margin: 2px;
         }
-        QTableWidget QScrollBar::handle:vertical:hover {
+        QTableView QScrollBar::handle:vertical:hover {
             background: #005a9e;
         }
-        QTableWidget QScrollBar:horizontal {
+        QTableView QScrollBar:horizontal {
             background: #2d2d2d;
             height: 15px;
         }
-        QTableWidget QScrollBar::handle:horizontal {
+        QTableView QScrollBar::handle:horizontal {
             background: #007acc;
             border-radius: 7px;
             min-width: 25px;
@@ -3038,9 +3658,17 @@ class BudgetDialog(QDialog):
     """)
         self.budgets_table.setShowGrid(True)
         self.budgets_table.verticalHeader().setVisible(False)
+        # Fixed row height, so rows are never measured individually
+        self.budgets_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.budgets_table.verticalHeader().setDefaultSectionSize(35)
+        self.budgets_table.setAlternatingRowColors(True)
+        # Remove buttons are painted by a delegate rather than a widget per row
+        self.remove_delegate = RemoveButtonDelegate(self.budgets_table)
+        self.budgets_table.setItemDelegateForColumn(3, self.remove_delegate)
+        self.remove_delegate.removeClicked.connect(self.remove_budget)
         
         layout.addWidget(self.budgets_table)
-        self.update_budgets_table()  # This will populate data and trigger auto-resize
+        self.update_budgets_table()
         
         # Summary
         self.summary_label = QLabel()
@@ -3179,6 +3807,9 @@ class BudgetDialog(QDialog):
         self.progress_layout = QVBoxLayout(self.progress_container)
         self.progress_layout.setContentsMargins(15, 15, 15, 15)
         self.progress_layout.setSpacing(10)
+        # Bar widgets by category, reused across refreshes
+        self._bar_rows = {}
+        self._no_budgets_label = None
         
         progress_scroll.setWidget(self.progress_container)
         bottom_layout.addWidget(progress_scroll)
@@ -3214,300 +3845,190 @@ class BudgetDialog(QDialog):
         self.category_combo.clear()
         
         # Get all unique categories
-        all_categories = set(self.data_manager.categories)
-        all_expenses = self.data_manager.list_all_expenses()
-        expense_categories = set(exp.get('category') for exp in all_expenses)
-        all_categories.update(expense_categories)
-        
+        all_categories = self.data_manager.get_known_categories()
         self.category_combo.addItems(sorted(all_categories))
     
-    def update_budgets_table(self):
+    def _monthly_spending_map(self):
+        """Return this month's {lowercased category: spending} in one pass."""
+        current_month = datetime.now().strftime("%Y-%m")
+        return self.data_manager.budget_manager.get_monthly_spending_map(current_month)
+
+    def _compute_state(self, spending_map=None):
+        """Build the view state from one spending pass and one pass over budgets."""
+        budget_manager = self.data_manager.budget_manager
+        budgets = getattr(budget_manager, 'budgets', None) or {}
+        if spending_map is None:
+            spending_map = self._monthly_spending_map()
+        get_spending = spending_map.get
+        rows = [
+            (category, budget, get_spending(category.lower(), 0.0))
+            for category, budget in budgets.items()
+        ]
+        return BudgetsViewState(
+            rows=rows,
+            over=sum(1 for _, budget, spending in rows if spending > budget),
+            alerts=budget_manager.get_budget_alerts(spending_map),
+        )
+
+    def refresh_budget_views(self):
+        """Refresh table, summary, alerts and progress bars from one computed state."""
+        state = self._compute_state()
+        self.update_budgets_table(state)
+        self.update_summary(state)
+        self.update_progress_bars(state)
+
+    def _request_refresh(self):
+        """Queue one refresh for the next event-loop tick, however often it is asked for."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the queued refresh and notify dashboards of the budget change."""
+        self._refresh_pending = False
+        self.refresh_budget_views()
+        self.data_manager.update_budget_alerts()
+
+    def update_budgets_table(self, state=None):
         """Update the budgets table with current data - FIXED BUTTON ALIGNMENT."""
-        self.budgets_table.setRowCount(0)
-        
-        if hasattr(self.data_manager.budget_manager, 'budgets'):
-            current_month = datetime.now().strftime("%Y-%m")
-            
-            for row, (category, budget) in enumerate(self.data_manager.budget_manager.budgets.items()):
-                self.budgets_table.insertRow(row)
-                
-                # Calculate current spending
-                spending = self.data_manager.budget_manager._get_monthly_spending(category, current_month)
-                
-                # Category
-                category_item = QTableWidgetItem(category)
-                category_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                self.budgets_table.setItem(row, 0, category_item)
-                
-                # Budget amount
-                budget_item = QTableWidgetItem(f"₱{budget:,.2f}")
-                budget_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.budgets_table.setItem(row, 1, budget_item)
-                
-                # Current spending with color coding
-                spending_item = QTableWidgetItem(f"₱{spending:,.2f}")
-                spending_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                if spending > budget:
-                    spending_item.setForeground(QColor("#ff6b6b"))
-                elif spending > budget * 0.8:
-                    spending_item.setForeground(QColor("#ffb86c"))
-                else:
-                    spending_item.setForeground(QColor("#6bff6b"))
-                self.budgets_table.setItem(row, 2, spending_item)
-                
-                # Remove button - FIXED: Perfect alignment with proper margins
-                remove_btn = QPushButton("Remove")
-                remove_btn.setFixedSize(75, 28)  # Optimal size
-                remove_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ff4444;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        font-family: "Segoe UI";
-                        font-size: 11px;
-                        margin: 2px;
-                    }
-                    QPushButton:hover {
-                        background-color: #cc0000;
-                    }
-                """)
-                remove_btn.clicked.connect(lambda checked, cat=category: self.remove_budget(cat))
-                
-                # Set the button directly in the cell (no container needed)
-                self.budgets_table.setCellWidget(row, 3, remove_btn)
-            
-            # Set optimized column widths
-            self.budgets_table.setColumnWidth(0, 130)  # Category
-            self.budgets_table.setColumnWidth(1, 110)  # Budget Limit  
-            self.budgets_table.setColumnWidth(2, 120)  # Current Spending
-            self.budgets_table.setColumnWidth(3, 85)   # Actions - perfect for button
-            
-            # Set row height
-            self.budgets_table.verticalHeader().setDefaultSectionSize(35)
-            
-            # Enable alternating colors
-            self.budgets_table.setAlternatingRowColors(True)
+        if state is None:
+            state = self._compute_state()
+        self.budgets_model.set_rows(state.rows)
     
-    def update_summary(self):
+    def update_summary(self, state=None):
         """Update the budgets summary."""
-        budgets = getattr(self.data_manager.budget_manager, 'budgets', {})
+        if state is None:
+            state = self._compute_state()
         
-        if not budgets:
+        if not state.rows:
             self.summary_label.setText("📊 No budgets set. Use the 'Set Budget' tab to create budgets.")
             return
         
-        total_budgets = len(budgets)
-        current_month = datetime.now().strftime("%Y-%m")
-        over_budget_count = 0
-        
-        for category, budget in budgets.items():
-            spending = self.data_manager.budget_manager._get_monthly_spending(category, current_month)
-            if spending > budget:
-                over_budget_count += 1
-        
-        summary_text = f"📈 Summary: {total_budgets} active budgets"
-        if over_budget_count > 0:
-            summary_text += f" | 🚨 {over_budget_count} over budget"
+        summary_text = f"📈 Summary: {len(state.rows)} active budgets"
+        if state.over > 0:
+            summary_text += f" | 🚨 {state.over} over budget"
         else:
             summary_text += " | ✅ All within budget"
         
         self.summary_label.setText(summary_text)
     
-    def update_alerts(self):
+    def update_alerts(self, state=None):
         """Update budget alerts with dynamic header coloring"""
-        alerts = self.data_manager.budget_manager.check_budget_alerts()
-        budgets_exist = bool(getattr(self.data_manager.budget_manager, 'budgets', {}))
+        if state is None:
+            state = self._compute_state()
+        alerts = state.alerts
+        budgets_exist = bool(state.rows)
         
         if not budgets_exist:
             # No budgets set - neutral styling
             self.alerts_header.setText("📋 BUDGET ALERTS")
-            self.alerts_header.setStyleSheet("""
-                QLabel {
-                    color: #b0b0b0;  /* Neutral gray */
-                    font-weight: bold;
-                    font-size: 14px;
-                    padding: 8px;
-                    background: #2d2d2d;
-                    border-radius: 6px;
-                    border: 1px solid #404040;  /* Neutral border */
-                }
-            """)
+            self.alerts_header.setStyleSheet(QSS_ALERT_HEADER_NEUTRAL)
             self.alerts_text.setHtml(
                 "<b>💡 No Budgets Set</b><br><br>"
                 "Use the 'Set Budget' tab to create monthly spending limits. "
                 "Budget alerts will appear here when you have active budgets."
             )
-            self.alerts_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #2d2d2d;
-                    color: #b0b0b0;
-                    border: 1px solid #404040;
-                    border-radius: 8px;
-                    padding: 12px;
-                    font-family: "Segoe UI";
-                    font-size: 12px;
-                    line-height: 1.4;
-                }
-            """)
+            self.alerts_text.setStyleSheet(QSS_ALERTS_TEXT_MUTED)
             
         elif alerts:
             # Check if there are critical alerts (over budget)
-            has_critical_alerts = any("🚨" in alert for alert in alerts)
+            max_severity = max(severity for severity, _ in alerts)
             
-            if has_critical_alerts:
+            if max_severity == Severity.CRITICAL:
                 # Critical alerts - red styling
                 self.alerts_header.setText("🚨 CRITICAL BUDGET ALERTS")
-                self.alerts_header.setStyleSheet("""
-                    QLabel {
-                        color: #ff6b6b;  /* Red text */
-                        font-weight: bold;
-                        font-size: 14px;
-                        padding: 8px;
-                        background: #442222;  /* Dark red background */
-                        border-radius: 6px;
-                        border: 1px solid #ff4444;  /* Red border */
-                    }
-                """)
+                self.alerts_header.setStyleSheet(QSS_ALERT_HEADER_CRITICAL)
             else:
                 # Only warning alerts - orange styling
                 self.alerts_header.setText("⚠️ BUDGET WARNINGS")
-                self.alerts_header.setStyleSheet("""
-                    QLabel {
-                        color: #ffb86c;  /* Orange text */
-                        font-weight: bold;
-                        font-size: 14px;
-                        padding: 8px;
-                        background: #443322;  /* Dark orange background */
-                        border-radius: 6px;
-                        border: 1px solid #ffa500;  /* Orange border */
-                    }
-                """)
+                self.alerts_header.setStyleSheet(QSS_ALERT_HEADER_WARN)
             
             # Set alerts content
-            alerts_text = "<b>Current Alerts:</b><br><br>"
-            for alert in alerts:
-                alerts_text += f"• {alert}<br>"
+            alerts_text = "<b>Current Alerts:</b><br><br>" + "".join(
+                f"• {alert}<br>" for _, alert in alerts
+            )
             
             self.alerts_text.setHtml(alerts_text)
-            self.alerts_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    border: 1px solid #404040;
-                    border-radius: 8px;
-                    padding: 12px;
-                    font-family: "Segoe UI";
-                    font-size: 12px;
-                    line-height: 1.4;
-                }
-            """)
+            self.alerts_text.setStyleSheet(QSS_ALERTS_TEXT)
             
         else:
             # Budgets exist but no alerts - green success styling
             self.alerts_header.setText("✅ ALL BUDGETS GOOD")
-            self.alerts_header.setStyleSheet("""
-                QLabel {
-                    color: #6bff6b;  /* Green text */
-                    font-weight: bold;
-                    font-size: 14px;
-                    padding: 8px;
-                    background: #224422;  /* Dark green background */
-                    border-radius: 6px;
-                    border: 1px solid #00ff00;  /* Green border */
-                }
-            """)
+            self.alerts_header.setStyleSheet(QSS_ALERT_HEADER_GOOD)
             self.alerts_text.setHtml(
                 "<b>✅ All Budgets Within Limits</b><br><br>"
                 "Great job! All your spending is within the budget limits you've set."
             )
-            self.alerts_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    border: 1px solid #404040;
-                    border-radius: 8px;
-                    padding: 12px;
-                    font-family: "Segoe UI";
-                    font-size: 12px;
-                    line-height: 1.4;
-                }
-            """)
+            self.alerts_text.setStyleSheet(QSS_ALERTS_TEXT)
     
-    def update_progress_bars(self):
+    def update_progress_bars(self, state=None):
         """Update budget progress bars with perfect alignment"""
-        print("DEBUG: update_progress_bars called")
-        
-        budgets = getattr(self.data_manager.budget_manager, 'budgets', {})
-        print(f"DEBUG: Number of budgets: {len(budgets)}")
+        if state is None:
+            state = self._compute_state()
+        logger.debug("Updating progress bars for %d budgets", len(state.rows))
         
         # Check if progress container exists
         if not hasattr(self, 'progress_container') or self.progress_container is None:
-            print("❌ ERROR: progress_container doesn't exist!")
+            logger.error("Budget progress container is missing")
             return
         
         layout = self.progress_layout
-        
-        # Clear existing progress bars
-        print(f"DEBUG: Clearing {layout.count()} existing items")
+        # Sync the bars behind a single repaint
+        self.progress_container.setUpdatesEnabled(False)
+        try:
+            self._sync_progress_bars(layout, state.rows)
+        finally:
+            self.progress_container.setUpdatesEnabled(True)
+
+        self.update_alerts(state)
+
+    def _sync_progress_bars(self, layout, rows):
+        """Lay out one bar per budget, reusing the widgets of unchanged categories."""
+        # Detach everything; kept widgets are re-added in budget order below
+        logger.debug("Detaching %d progress layout items", layout.count())
         while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        current_month = datetime.now().strftime("%Y-%m")
-        
-        if not budgets:
+            layout.takeAt(0)
+
+        current = {category for category, _, _ in rows}
+        for category in [c for c in self._bar_rows if c not in current]:
+            self._bar_rows.pop(category)["widget"].deleteLater()
+
+        if not rows:
             # Show message when no budgets
-            no_budgets_label = QLabel("🎯 No budgets set yet!\n\nUse the 'Set Budget' tab to create budgets.")
-            no_budgets_label.setStyleSheet("""
-                QLabel {
-                    color: #b0b0b0; 
-                    font-size: 14px;
-                    font-style: italic; 
-                    padding: 40px;
-                    background: #2d2d2d;
-                    border: 2px dashed #404040;
-                    border-radius: 12px;
-                    text-align: center;
-                    line-height: 1.6;
-                }
-            """)
-            no_budgets_label.setAlignment(Qt.AlignCenter)
-            no_budgets_label.setMinimumHeight(150)
-            layout.addWidget(no_budgets_label)
+            if self._no_budgets_label is None:
+                self._no_budgets_label = QLabel("🎯 No budgets set yet!\n\nUse the 'Set Budget' tab to create budgets.")
+                self._no_budgets_label.setStyleSheet(QSS_NO_BUDGETS_LABEL)
+                self._no_budgets_label.setAlignment(Qt.AlignCenter)
+                self._no_budgets_label.setMinimumHeight(150)
+            layout.addWidget(self._no_budgets_label)
         else:
-            # Create bar charts for ALL budgets
-            for category, budget in budgets.items():
-                spending = self.data_manager.budget_manager._get_monthly_spending(category, current_month)
+            if self._no_budgets_label is not None:
+                self._no_budgets_label.deleteLater()
+                self._no_budgets_label = None
+            # Bound once, outside the per-budget loop
+            bar_rows = self._bar_rows
+            create_row = self.create_bar_chart_row
+            update_row = self.update_bar_chart_row
+            add_widget = layout.addWidget
+            for category, budget, spending in rows:
                 percentage = min((spending / budget) * 100, 100) if budget > 0 else 0
-                
-                print(f"DEBUG: Creating bar chart for {category}: {spending}/{budget} ({percentage}%)")
-                
-                # Create bar chart widget
-                bar_chart_widget = self.create_bar_chart_widget(category, spending, budget, percentage)
-                layout.addWidget(bar_chart_widget)
+
+                row = bar_rows.get(category)
+                if row is None:
+                    logger.debug("Creating bar chart for %s", category)
+                    row = bar_rows[category] = create_row(category)
+                update_row(row, spending, budget, percentage)
+                add_widget(row["widget"])
         
         # Add stretch to push content to top
         layout.addStretch()
-
-        self.update_alerts()
-        
-        print("DEBUG: Bar charts update completed successfully")
     
-    def create_bar_chart_widget(self, category, spending, budget, percentage):
-        """Create a perfectly aligned bar chart widget"""
+    def create_bar_chart_row(self, category):
+        """Create a perfectly aligned bar chart widget, returned with its updatable parts"""
         widget = QWidget()
         widget.setFixedHeight(70)  # Optimal height for alignment
-        widget.setStyleSheet("""
-            QWidget {
-                background: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                margin: 2px;
-            }
-        """)
+        widget.setStyleSheet(QSS_BAR_CONTAINER)
         
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -3522,25 +4043,11 @@ class BudgetDialog(QDialog):
         
         # Category name
         category_label = QLabel(category)
-        category_label.setStyleSheet("""
-            QLabel {
-                color: #e0e0e0; 
-                font-weight: bold; 
-                font-size: 13px;
-                padding: 2px 0px;
-            }
-        """)
+        category_label.setStyleSheet(QSS_BAR_CATEGORY)
         
         # Amounts
-        amounts_label = QLabel(f"₱{spending:,.0f} / ₱{budget:,.0f}")
-        amounts_label.setStyleSheet("""
-            QLabel {
-                color: #b0b0b0; 
-                font-size: 11px;
-                font-weight: bold;
-                padding: 2px 0px;
-            }
-        """)
+        amounts_label = QLabel()
+        amounts_label.setStyleSheet(QSS_BAR_AMOUNTS)
         
         left_layout.addWidget(category_label)
         left_layout.addWidget(amounts_label)
@@ -3553,59 +4060,11 @@ class BudgetDialog(QDialog):
         center_layout.setSpacing(4)
         
         # Percentage label
-        status_color = "#ff6b6b" if percentage > 100 else "#ffb86c" if percentage > 80 else "#6bff6b"
-        status_text = "OVER" if percentage > 100 else "WARNING" if percentage > 80 else "GOOD"
-        percentage_label = QLabel(f"{percentage:.1f}% - {status_text}")
-        percentage_label.setStyleSheet(f"""
-            QLabel {{
-                color: {status_color}; 
-                font-weight: bold; 
-                font-size: 11px;
-                padding: 1px 0px;
-            }}
-        """)
+        percentage_label = QLabel()
         percentage_label.setAlignment(Qt.AlignCenter)
         
         # Bar chart
-        bar_widget = QWidget()
-        bar_widget.setFixedHeight(20)
-        bar_widget.setStyleSheet("""
-            QWidget {
-                background: #1a1a2e;
-                border: 1px solid #404040;
-                border-radius: 10px;
-            }
-        """)
-        
-        bar_layout = QHBoxLayout(bar_widget)
-        bar_layout.setContentsMargins(2, 2, 2, 2)
-        bar_layout.setSpacing(0)
-        
-        # Progress bar fill
-        fill_width = min(int(percentage), 100)
-        
-        # Determine fill color based on percentage
-        if percentage > 100:
-            fill_color = "#ff4444"  # Bright red for over budget
-        elif percentage > 80:
-            fill_color = "#ffaa00"  # Orange for warning
-        else:
-            fill_color = "#00cc00"  # Green for good
-        
-        fill_widget = QWidget()
-        fill_widget.setStyleSheet(f"""
-            QWidget {{
-                background: {fill_color};
-                border-radius: 8px;
-            }}
-        """)
-        
-        # Remaining space
-        remaining_widget = QWidget()
-        remaining_widget.setStyleSheet("background: transparent;")
-        
-        bar_layout.addWidget(fill_widget, fill_width)
-        bar_layout.addWidget(remaining_widget, 100 - fill_width)
+        bar_widget = BarWidget()
         
         center_layout.addWidget(percentage_label)
         center_layout.addWidget(bar_widget)
@@ -3614,7 +4073,31 @@ class BudgetDialog(QDialog):
         layout.addWidget(left_widget)
         layout.addWidget(center_widget, 1)  # Center takes remaining space
         
-        return widget
+        return {
+            "widget": widget,
+            "amounts_label": amounts_label,
+            "pct_label": percentage_label,
+            "bar": bar_widget,
+            "status": None,
+        }
+
+    def update_bar_chart_row(self, row, spending, budget, percentage):
+        """Refresh a bar chart row's amounts, percentage and fill in place."""
+        if percentage > 100:
+            status_text, pct_qss, fill_brush = "OVER", QSS_PCT_RED, BarWidget.FILL_RED
+        elif percentage > 80:
+            status_text, pct_qss, fill_brush = "WARNING", QSS_PCT_ORANGE, BarWidget.FILL_ORANGE
+        else:
+            status_text, pct_qss, fill_brush = "GOOD", QSS_PCT_GREEN, BarWidget.FILL_GREEN
+
+        row["amounts_label"].setText(f"₱{spending:,.0f} / ₱{budget:,.0f}")
+        row["pct_label"].setText(f"{percentage:.1f}% - {status_text}")
+        # Restyle only when the status colour changes
+        if row["status"] != status_text:
+            row["pct_label"].setStyleSheet(pct_qss)
+            row["status"] = status_text
+
+        row["bar"].setValue(min(int(percentage), 100), fill_brush)
     
     def set_budget(self):
         """Set budget for selected category."""
@@ -3651,33 +4134,14 @@ class BudgetDialog(QDialog):
         if success:
             QMessageBox.information(self, "Success", f"Budget set for {final_category}: ₱{amount:,.2f}")
             self.amount_input.clear()
-            # Refresh all displays
-            self.update_budgets_table()
-            self.update_summary()
-            self.update_alerts()
-            self.update_progress_bars()
-            # Trigger dashboard refresh
-            self.data_manager.update_budget_alerts()
+            # Refresh all displays and dashboards once control returns to the loop
+            self._request_refresh()
         else:
             QMessageBox.warning(self, "Error", "Failed to set budget.")
     
     def find_matching_category(self, category):
         """Find existing category with case-insensitive matching."""
-        category_lower = category.lower()
-        
-        # Check in main categories list
-        for existing_cat in self.data_manager.categories:
-            if existing_cat.lower() == category_lower:
-                return existing_cat
-        
-        # Check in expense categories
-        all_expenses = self.data_manager.list_all_expenses()
-        expense_categories = set(exp.get('category') for exp in all_expenses)
-        for existing_cat in expense_categories:
-            if existing_cat.lower() == category_lower:
-                return existing_cat
-        
-        return None
+        return self.data_manager.find_category(category)
     
     def remove_budget(self, category):
         """Remove budget for selected category."""
@@ -3689,12 +4153,7 @@ class BudgetDialog(QDialog):
             success = self.data_manager.budget_manager.remove_budget(category)
             if success:
                 QMessageBox.information(self, "Success", f"Budget removed for {category}")
-                # Refresh all displays
-                self.update_budgets_table()
-                self.update_summary()
-                self.update_alerts()
-                self.update_progress_bars()
-                # Trigger dashboard refresh
-                self.data_manager.update_budget_alerts()
+                # Refresh all displays and dashboards once control returns to the loop
+                self._request_refresh()
             else:
                 QMessageBox.warning(self, "Error", "Failed to remove budget.")
\ No newline at end of file
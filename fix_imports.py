@@ -1,27 +1,49 @@
 ﻿import ast
+import mmap
 import os
+from collections import Counter
+
+
+class ImportCollector(ast.NodeVisitor):
+    """Count every import in one pass, including those inside functions and try blocks."""
+
+    def __init__(self):
+        self.imports = Counter()
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.imports[alias.name] += 1
+
+    def visit_ImportFrom(self, node):
+        if node.module:
+            for alias in node.names:
+                self.imports[f"{node.module}.{alias.name}"] += 1
+
 
 def remove_unused_imports(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+    if os.path.getsize(filepath) == 0:
+        return  # Nothing to map or parse
+
     try:
-        tree = ast.parse(content)
+        # Parse straight from the mapped bytes instead of decoding a copy
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tree = ast.parse(mm, filename=filepath)
         
         # Find all imports
-        imports = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.add(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    for alias in node.names:
-                        imports.add(f"{node.module}.{alias.name}")
-        
+        collector = ImportCollector()
+        collector.visit(tree)
+        imports = collector.imports
+
+        # Names imported more than once, e.g. at the top and again in a function
+        for name, count in sorted(imports.items()):
+            if count > 1:
+                print(f"{filepath}: '{name}' is imported {count} times")
+
         # Simple heuristic: if import is only used in type hints, keep it
         # For now, we'll just manually fix the obvious ones
-        
+        return imports
+
     except SyntaxError:
         print(f"Syntax error in {filepath}, skipping")
         return
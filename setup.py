@@ -7,12 +7,14 @@ setup(
     install_requires=[
         "PyQt5>=5.15",
         "pandas>=1.5",
+        "numpy>=1.21",
         "openpyxl>=3.0",
         "fpdf>=1.7",
         "reportlab>=4.0",
         "matplotlib>=3.5",
     ],
     extras_require={
+        "fast": ["orjson>=3.6"],
         "dev": [
             "pytest>=7.0",
             "pytest-qt>=4.0",
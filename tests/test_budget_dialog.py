@@ -1,6 +1,10 @@
+from unittest.mock import patch
+
 import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
 from PyQt5.QtWidgets import QApplication
-from expense_tracker_app.widgets import BudgetDialog
+from expense_tracker_app.widgets import BudgetDialog, BudgetsModel
 from expense_tracker_app.data_manager import DataManager
 
 class TestBudgetDialog:
@@ -32,4 +36,86 @@ class TestBudgetDialog:
         
         success = data_manager.budget_manager.remove_budget("Food")
         assert success is True
-        assert "Food" not in data_manager.budget_manager.budgets
\ No newline at end of file
+        assert "Food" not in data_manager.budget_manager.budgets
+
+    def test_remove_button_dispatches_row_category(self, app, tmp_path, monkeypatch):
+        """Each row's Remove button removes that row's budget"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.budget_manager.set_budget("Food", 100.0)
+        data_manager.budget_manager.set_budget("Travel", 50.0)
+
+        with patch.object(BudgetDialog, "remove_budget") as mock_remove:
+            dialog = BudgetDialog(data_manager)
+            dialog.resize(800, 600)
+            dialog.show()
+            table = dialog.budgets_table
+            cell_rect = table.visualRect(table.model().index(1, 3))
+            button_rect = dialog.remove_delegate._button_rect(cell_rect)
+
+            QTest.mouseClick(table.viewport(), Qt.LeftButton, pos=button_rect.center())
+
+        mock_remove.assert_called_once_with(table.model().index(1, 0).data())
+        assert table.indexWidget(table.model().index(1, 3)) is None
+
+    def test_budgets_model_rows(self, app):
+        """BudgetsModel formats amounts and colours spending against the budget"""
+        model = BudgetsModel()
+        model.set_rows([("Food", 100.0, 120.0), ("Travel", 1000.0, 50.0)])
+
+        assert model.rowCount() == 2
+        assert model.index(0, 0).data() == "Food"
+        assert model.index(1, 1).data() == "₱1,000.00"
+        assert model.index(0, 2).data() == "₱120.00"
+        assert model.index(0, 2).data(Qt.ForegroundRole) == BudgetsModel.OVER_BUDGET_BRUSH
+        assert model.index(1, 2).data(Qt.ForegroundRole) == BudgetsModel.UNDER_BUDGET_BRUSH
+
+    def test_progress_bars_reuse_rows(self, app, tmp_path, monkeypatch):
+        """Refreshing keeps existing bar widgets and drops removed budgets"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.budget_manager.set_budget("Food", 100.0)
+        data_manager.budget_manager.set_budget("Travel", 50.0)
+        dialog = BudgetDialog(data_manager)
+
+        food_widget = dialog._bar_rows["Food"]["widget"]
+        data_manager.budget_manager.set_budget("Food", 200.0)
+        data_manager.budget_manager.remove_budget("Travel")
+        dialog.refresh_budget_views()
+
+        assert list(dialog._bar_rows) == ["Food"]
+        assert dialog._bar_rows["Food"]["widget"] is food_widget
+        assert dialog._bar_rows["Food"]["amounts_label"].text() == "₱0 / ₱200"
+        assert dialog._bar_rows["Food"]["bar"].percentage == 0
+
+    def test_refresh_requests_coalesce(self, app, tmp_path, monkeypatch):
+        """Several refresh requests in one tick run a single refresh"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        dialog = BudgetDialog(data_manager)
+
+        with patch.object(dialog, "refresh_budget_views") as mock_refresh:
+            dialog._request_refresh()
+            dialog._request_refresh()
+            assert mock_refresh.call_count == 0
+
+            app.processEvents()
+
+        mock_refresh.assert_called_once_with()
+        assert dialog._refresh_pending is False
+
+    def test_compute_state_single_pass(self, app, tmp_path, monkeypatch):
+        """The view state pairs each budget with its spending and counts overruns"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.budget_manager.set_budget("Food", 100.0)
+        data_manager.budget_manager.set_budget("Travel", 50.0)
+        dialog = BudgetDialog(data_manager)
+
+        state = dialog._compute_state({"food": 150.0})
+
+        assert state.rows == [("Food", 100.0, 150.0), ("Travel", 50.0, 0.0)]
+        assert state.over == 1
+        assert [message for _, message in state.alerts] == (
+            data_manager.budget_manager.check_budget_alerts({"food": 150.0})
+        )
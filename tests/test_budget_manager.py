@@ -1,6 +1,6 @@
 import pytest
 import os
-from expense_tracker_app.budget_manager import BudgetManager
+from expense_tracker_app.budget_manager import BudgetManager, Severity
 from expense_tracker_app.data_manager import DataManager
 
 class TestBudgetManager:
@@ -152,4 +152,61 @@ class TestBudgetManager:
         alerts = budget_manager.check_budget_alerts()
         print(f"Alerts: {alerts}")
         
-        assert True
\ No newline at end of file
+        assert True
+
+    def test_monthly_spending_map_single_pass(self, tmp_path, monkeypatch):
+        """Spending is bucketed by lowercased category for the given month"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.expenses = {
+            "Food": [
+                {"amount": 10.0, "date": "2024-03-01"},
+                {"amount": "2.5", "date": "2024-03-15"},
+                {"amount": 99.0, "date": "2024-02-28"},
+                {"amount": "bad", "date": "2024-03-02"},
+            ],
+            "TRAVEL": [{"amount": 20.0, "date": "2024-03-09"}],
+        }
+        budget_manager = BudgetManager(data_manager)
+
+        spending = budget_manager.get_monthly_spending_map("2024-03")
+
+        assert spending == {"food": 12.5, "travel": 20.0}
+        assert budget_manager._get_monthly_spending("Travel", "2024-03") == 20.0
+
+        # Appending a record invalidates the cached expense columns
+        data_manager.expenses["Food"].append({"amount": 5.0, "date": "2024-03-20"})
+        assert budget_manager.get_monthly_spending_map("2024-03")["food"] == 17.5
+
+    def test_get_budget_alerts_severity(self, tmp_path, monkeypatch):
+        """Alerts carry their severity alongside the message"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        budget_manager = BudgetManager(data_manager)
+        budget_manager.budgets = {"Food": 100.0, "Travel": 100.0, "Bills": 100.0}
+        spending_map = {"food": 150.0, "travel": 90.0, "bills": 10.0}
+
+        alerts = budget_manager.get_budget_alerts(spending_map)
+
+        assert [severity for severity, _ in alerts] == [Severity.CRITICAL, Severity.WARN]
+        assert budget_manager.check_budget_alerts(spending_map) == [m for _, m in alerts]
+
+    def test_get_all_budgets_aggregates_once(self, tmp_path, monkeypatch):
+        """All budget progress comes from a single monthly aggregation"""
+        monkeypatch.chdir(tmp_path)
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        budget_manager = BudgetManager(data_manager)
+        budget_manager.budgets = {"Food": 100.0, "Travel": 50.0}
+        calls = []
+
+        def fake_totals(month):
+            calls.append(month)
+            return {"Food": 25.0}
+
+        monkeypatch.setattr(data_manager, "get_monthly_category_totals", fake_totals)
+
+        progress = budget_manager.get_all_budgets()
+
+        assert len(calls) == 1
+        assert progress["Food"]["spent"] == 25.0
+        assert progress["Travel"]["remaining"] == 50.0
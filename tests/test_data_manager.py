@@ -7,7 +7,9 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from expense_tracker_app.data_manager import DataManager
+from expense_tracker_app.data_manager import (DataManager, parse_date,
+                                              refresh_dashboards,
+                                              register_dashboard)
 
 
 class TestDataManager:
@@ -96,6 +98,75 @@ class TestDataManager:
         assert "Food" in saved_data["expenses"]
         assert "Travel" in saved_data["categories"]
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_and_load_round_trip(self, use_orjson):
+        from expense_tracker_app import data_manager as dm_module
+
+        if use_orjson and not dm_module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        expenses = {
+            "Café": [
+                {"amount": 10.5, "date": "2023-01-01", "description": "Ñandú", "id": 1}
+            ]
+        }
+        self.data_manager.expenses = expenses
+        self.data_manager.categories = ["Café"]
+
+        with patch.object(dm_module, "HAS_ORJSON", use_orjson):
+            self.data_manager.save_data()
+            reloaded = DataManager(file_path=self.temp_file.name)
+
+        assert reloaded.expenses == expenses
+        assert reloaded.categories == ["Café"]
+
+    @pytest.mark.unit
+    def test_saved_file_format_does_not_depend_on_orjson(self):
+        from expense_tracker_app import data_manager as dm_module
+
+        self.data_manager.expenses = {
+            "Food": [{"amount": 10.5, "date": "2023-01-01", "id": 1}]
+        }
+        written = []
+        for use_orjson in (True, False):
+            with patch.object(dm_module, "HAS_ORJSON", use_orjson):
+                self.data_manager.save_data()
+            with open(self.temp_file.name, "rb") as f:
+                written.append(f.read())
+
+        assert written[0] == written[1]
+        assert b'\n    "expenses"' in written[0]
+
+    @pytest.mark.unit
+    def test_load_accepts_non_finite_numbers_from_stdlib_json(self):
+        with open(self.temp_file.name, "w") as f:
+            f.write('{"expenses": {"Food": [{"amount": Infinity, "id": 1}]}}')
+
+        reloaded = DataManager(file_path=self.temp_file.name)
+
+        assert reloaded.expenses["Food"][0]["amount"] == float("inf")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("amount", ["inf", "-inf", "nan"])
+    def test_add_expense_rejects_non_finite_amount(self, amount):
+        with pytest.raises(ValueError):
+            self.data_manager.add_expense("Food", amount, "2023-01-01", "Bad")
+
+    @pytest.mark.unit
+    def test_save_data_failure_keeps_previous_file(self):
+        self.data_manager.expenses = {"Food": [{"amount": 1.0, "date": "2023-01-01"}]}
+        self.data_manager.save_data()
+        with open(self.temp_file.name, "rb") as f:
+            saved = f.read()
+
+        self.data_manager.expenses = {}
+        with patch("expense_tracker_app.data_manager.os.replace", side_effect=OSError):
+            self.data_manager.save_data()  # Logged, not raised
+
+        with open(self.temp_file.name, "rb") as f:
+            assert f.read() == saved
+        assert not os.path.exists(self.temp_file.name + ".tmp")
+
     @pytest.mark.unit
     def test_save_data_no_filename(self):
         dm = DataManager(filename="")
@@ -125,6 +196,29 @@ class TestDataManager:
                 self.data_manager.save_data()
                 mock_error.assert_called()
 
+    @pytest.mark.unit
+    def test_add_expenses_bulk_saves_once_and_skips_invalid_rows(self):
+        self.data_manager.expenses = {"Food": [{"id": 7, "amount": 1.0, "date": "2023-01-01"}]}
+
+        with patch.object(self.data_manager, "save_data") as mock_save, patch.object(
+            self.data_manager, "update_budget_alerts"
+        ) as mock_alerts, patch.object(self.data_manager, "debug_expense_categories"):
+            added = self.data_manager.add_expenses_bulk(
+                [
+                    ("food", 10.0, "2023-01-02", "Lunch"),
+                    ("Travel", "bad", "2023-01-02", "Bus"),
+                    ("Travel", 5.0, "02/01/2023", "Train"),
+                    ("books", 12.0, "2023-01-03", "Novel"),
+                ]
+            )
+
+        assert added == 2
+        mock_save.assert_called_once()
+        mock_alerts.assert_called_once()
+        assert [r["id"] for r in self.data_manager.expenses["Food"]] == [7, 8]
+        assert self.data_manager.expenses["Books"][0]["id"] == 9
+        assert "Books" in self.data_manager.categories
+
     @pytest.mark.unit
     def test_add_category_new(self):
         initial_count = len(self.data_manager.categories)
@@ -187,6 +281,19 @@ class TestDataManager:
         assert expense["description"] == "Dinner"
         assert "id" in expense
 
+    @pytest.mark.unit
+    def test_add_expense_ids_follow_highest_stored_id(self):
+        self.data_manager.expenses = {
+            "Food": [{"id": 3, "amount": 1.0, "date": "2023-01-01"}],
+            "Travel": [{"id": 5, "amount": 2.0, "date": "2023-01-02"}],
+        }
+
+        self.data_manager.add_expense("Food", 4.0, "2023-01-03", "Lunch")
+        self.data_manager.add_expense("Bills", 6.0, "2023-01-04", "Power")
+
+        assert self.data_manager.expenses["Food"][-1]["id"] == 6
+        assert self.data_manager.expenses["Bills"][0]["id"] == 7
+
     @pytest.mark.unit
     def test_add_expense_new_category_auto_add(self):
         self.data_manager.add_expense("NewCategory", 15.0, "2023-01-01", "Test")
@@ -287,6 +394,70 @@ class TestDataManager:
         dates = [exp["date"] for exp in sorted_expenses["Food"]]
         assert dates == ["2023-01-01", "2023-01-02"]
 
+    @pytest.mark.unit
+    def test_parse_date_memoized(self):
+        parse_date.cache_clear()
+        assert parse_date("2023-01-02") == datetime(2023, 1, 2)
+        assert parse_date("2023-01-02") is parse_date("2023-01-02")
+        assert parse_date.cache_info().hits == 2
+        with pytest.raises(ValueError):
+            parse_date("01-02-2023")
+        with pytest.raises(ValueError):
+            parse_date("2023-02-30")
+        # Non-canonical forms still go through strptime
+        assert parse_date("2023-1-2") == datetime(2023, 1, 2)
+
+    @pytest.mark.unit
+    def test_get_sorted_expenses_cached_until_save(self):
+        self.data_manager.expenses = {
+            "Food": [{"amount": 10.0, "date": "2023-01-02", "description": "Lunch"}]
+        }
+
+        sorted_expenses = self.data_manager.get_sorted_expenses()
+        assert self.data_manager.get_sorted_expenses() is sorted_expenses
+
+        self.data_manager.expenses["Food"].append(
+            {"amount": 20.0, "date": "2023-01-01", "description": "Breakfast"}
+        )
+        dates = [exp["date"] for exp in self.data_manager.get_sorted_expenses()["Food"]]
+        assert dates == ["2023-01-01", "2023-01-02"]
+
+        self.data_manager.expenses["Food"][0]["date"] = "2023-01-03"
+        self.data_manager.save_data()
+        dates = [exp["date"] for exp in self.data_manager.get_sorted_expenses()["Food"]]
+        assert dates == ["2023-01-01", "2023-01-03"]
+
+    @pytest.mark.unit
+    def test_get_sorted_expenses_orders_mixed_and_missing_dates(self):
+        self.data_manager.expenses = {
+            "Food": [
+                {"amount": 1.0, "description": "Undated"},
+                {"amount": 2.0, "date": "2023-10-01"},
+                {"amount": 3.0, "date": "2023-9-15"},
+            ]
+        }
+
+        ordered = self.data_manager.get_sorted_expenses()["Food"]
+
+        assert [exp["amount"] for exp in ordered] == [3.0, 2.0, 1.0]
+
+    @pytest.mark.unit
+    def test_get_report_columns(self):
+        self.data_manager.expenses = {
+            "Food": [
+                {"amount": 1.0, "date": "2023-01-02"},
+                {"amount": 2.0, "date": "", "category": "Snacks"},
+            ],
+            "Travel": [{"amount": 3.0, "date": "not a date"}],
+        }
+
+        entries, categories, ordinals = self.data_manager.get_report_columns()
+
+        assert [category for category, _ in entries] == ["Food", "Snacks", "Travel"]
+        assert categories.tolist() == ["food", "snacks", "travel"]
+        assert ordinals.tolist() == [datetime(2023, 1, 2).toordinal(), -1, -1]
+        assert self.data_manager.get_report_columns()[0] is entries
+
     @pytest.mark.unit
     def test_get_category_subtotals(self):
         self.data_manager.expenses = {
@@ -321,6 +492,19 @@ class TestDataManager:
         assert results[0][0] == "Food"
         assert "cafe" in results[0][1]["description"].lower()
 
+    @pytest.mark.unit
+    def test_search_expenses_sees_saved_edits(self):
+        record = {"amount": 10.0, "date": "2023-01-01", "description": "Lunch"}
+        self.data_manager.expenses = {"Food": [record]}
+        results = self.data_manager.search_expenses("LUNCH")
+        assert results == [("Food", record)]
+        assert self.data_manager.search_expenses("lunch") is results
+
+        record["description"] = "Brunch"
+        self.data_manager.save_data()
+        assert self.data_manager.search_expenses("lunch") == []
+        assert self.data_manager.search_expenses("brunch") == [("Food", record)]
+
     @pytest.mark.unit
     def test_search_expenses_no_match(self):
         self.data_manager.expenses = {
@@ -395,6 +579,100 @@ class TestDataManager:
         assert monthly_totals["2023-01"] == 30.0
         assert monthly_totals["2023-02"] == 30.0
 
+    @pytest.mark.unit
+    def test_get_monthly_totals_sorted_and_skips_undated(self):
+        self.data_manager.expenses = {
+            "Food": [
+                {"amount": 5.0, "date": "2023-03-02"},
+                {"amount": 7.0, "date": ""},
+            ],
+            "Travel": [{"amount": 12.5, "date": "2023-01-20"}],
+        }
+
+        monthly_totals = self.data_manager.get_monthly_totals()
+
+        assert list(monthly_totals) == ["2023-01", "2023-03"]
+        assert monthly_totals["2023-01"] == 12.5
+
+    @pytest.mark.unit
+    def test_get_monthly_totals_sees_saved_edits(self):
+        self.data_manager.expenses = {
+            "Food": [{"amount": "5", "date": "2023-12-31"}],
+        }
+        assert self.data_manager.get_monthly_totals() == {"2023-12": 5.0}
+
+        self.data_manager.expenses["Food"][0]["date"] = "2024-01-01"
+        self.data_manager.save_data()
+
+        assert self.data_manager.get_monthly_totals() == {"2024-01": 5.0}
+
+    @pytest.mark.unit
+    def test_get_known_categories(self):
+        self.data_manager.categories = ["Food", "Travel"]
+        self.data_manager.expenses = {
+            "Food": [{"amount": 1.0}],
+            "Imported": [{"amount": 2.0}],
+            "Empty": [],
+        }
+
+        assert self.data_manager.get_known_categories() == {"Food", "Travel", "Imported"}
+
+    @pytest.mark.unit
+    def test_get_sorted_categories_cached_until_keys_change(self):
+        self.data_manager.expenses = {"Travel": [], "Food": []}
+
+        first = self.data_manager.get_sorted_categories()
+        assert first == ("Food", "Travel")
+        assert self.data_manager.get_sorted_categories() is first
+
+        self.data_manager.expenses["Bills"] = []
+        assert self.data_manager.get_sorted_categories() == ("Bills", "Food", "Travel")
+
+    @pytest.mark.unit
+    def test_find_category_case_insensitive(self):
+        self.data_manager.categories = ["Food", "Travel"]
+        self.data_manager.expenses = {"FOOD": [{"amount": 1.0}], "Imported": [{"amount": 2.0}]}
+
+        assert self.data_manager.find_category("food") == "Food"
+        assert self.data_manager.find_category("IMPORTED") == "Imported"
+        assert self.data_manager.find_category("Bills") is None
+
+        self.data_manager.categories.append("Bills")
+        assert self.data_manager.find_category("bills") == "Bills"
+
+    @pytest.mark.unit
+    def test_get_category_subtotals_casts_amounts(self):
+        self.data_manager.expenses = {
+            "Food": [{"amount": 10.0}, {"amount": "2.5"}, {"amount": "bad"}],
+            "Travel": [],
+        }
+
+        assert self.data_manager.get_category_subtotals() == {
+            "Food": 12.5,
+            "Travel": 0.0,
+        }
+
+    @pytest.mark.unit
+    def test_get_monthly_category_totals(self):
+        self.data_manager.expenses = {
+            "Food": [
+                {"amount": 10.0, "date": "2024-03-01"},
+                {"amount": 5.0, "date": "2024-04-01"},
+                {"amount": 1.0, "date": ""},
+            ],
+            "Travel": [{"amount": 20.0, "date": "2024-03-09"}],
+        }
+
+        assert self.data_manager.get_monthly_category_totals("2024-03") == {
+            "Food": 10.0,
+            "Travel": 20.0,
+        }
+        columns = self.data_manager.get_expense_columns()
+        assert self.data_manager.get_expense_columns() is columns
+
+        self.data_manager.save_data()
+        assert self.data_manager.get_expense_columns() is not columns
+
     @pytest.mark.unit
     def test_list_all_expenses(self):
         self.data_manager.expenses = {
@@ -448,3 +726,17 @@ class TestDataManager:
         dm = DataManager()
         assert hasattr(dm, 'budget_manager')
         assert dm.budget_manager.data_manager == dm
+
+    @pytest.mark.unit
+    def test_refresh_dashboards_calls_registered_widgets(self):
+        live = Mock()
+        deleted = Mock()
+        deleted.update_dashboard.side_effect = RuntimeError("deleted")
+        register_dashboard(live)
+        register_dashboard(deleted)
+
+        refresh_dashboards()
+        refresh_dashboards()
+
+        assert live.update_dashboard.call_count == 2
+        deleted.update_dashboard.assert_called_once()
@@ -196,7 +196,7 @@ class TestDataImportService:
         else:
             # Alternative: check if expenses were added to the mock data manager
             # The import might directly modify the data_manager instead of returning data
-            mock_data_manager.add_expense.assert_called()
+            mock_data_manager.add_expenses_bulk.assert_called_once()
 
     @pytest.mark.unit
     def test_import_from_excel_invalid_amount(self):
@@ -222,7 +222,7 @@ class TestDataImportService:
         result = DataImportService.import_from_csv(temp_csv_file, mock_data_manager)
         assert result["success"] is True
         # Verify data manager was updated
-        mock_data_manager.add_expense.assert_called()
+        mock_data_manager.add_expenses_bulk.assert_called_once()
 
     @pytest.mark.unit
     def test_import_empty_file(self, mock_data_manager, temp_csv_file):
@@ -246,14 +246,68 @@ class TestMainWindow:
         assert len(date_filtered) == 1  # Should only return the Coffee expense
         assert date_filtered[0]["description"] == "Coffee"
 
+    @pytest.mark.gui
+    def test_get_filtered_expenses_masks_date_and_category(self, tmp_path):
+        """Filtering keeps in-range and undated records of the chosen category"""
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.expenses = {
+            "Food": [
+                {"amount": 10.0, "date": "2023-01-05", "description": "Lunch"},
+                {"amount": 20.0, "date": "2023-03-01", "description": "Late"},
+                {"amount": 5.0, "date": "", "description": "Undated"},
+            ],
+            "Travel": [{"amount": 30.0, "date": "2023-01-06", "description": "Bus"}],
+        }
+        window = Mock(data_manager=data_manager, _filtered_cache=None)
+        window.start_date.date.return_value = QDate(2023, 1, 1)
+        window.end_date.date.return_value = QDate(2023, 1, 31)
+
+        window.category_filter.currentText.return_value = "food "
+        food = MainWindow.get_filtered_expenses(window)
+        window.category_filter.currentText.return_value = "All"
+        everything = MainWindow.get_filtered_expenses(window)
+
+        assert [e["description"] for e in food] == ["Lunch", "Undated"]
+        assert [e["description"] for e in everything] == ["Lunch", "Undated", "Bus"]
+        assert everything[2] == {
+            "category": "Travel",
+            "amount": 30.0,
+            "date": "2023-01-06",
+            "description": "Bus",
+        }
+
+    @pytest.mark.gui
+    def test_get_filtered_expenses_reuses_result_until_inputs_change(self, tmp_path):
+        """Repeated filtering with the same inputs and data returns the cached list"""
+        data_manager = DataManager(file_path=str(tmp_path / "expenses.json"))
+        data_manager.expenses = {
+            "Food": [{"amount": 10.0, "date": "2023-01-05", "description": "Lunch"}]
+        }
+        window = Mock(data_manager=data_manager, _filtered_cache=None)
+        window.category_filter.currentText.return_value = "All"
+        window.start_date.date.return_value = QDate(2023, 1, 1)
+        window.end_date.date.return_value = QDate(2023, 1, 31)
+
+        first = MainWindow.get_filtered_expenses(window)
+        assert MainWindow.get_filtered_expenses(window) is first
+
+        window.end_date.date.return_value = QDate(2023, 1, 4)
+        assert MainWindow.get_filtered_expenses(window) == []
+
+        window.end_date.date.return_value = QDate(2023, 1, 31)
+        data_manager.expenses["Food"][0]["description"] = "Brunch"
+        data_manager.save_data()
+        refreshed = MainWindow.get_filtered_expenses(window)
+        assert refreshed is not first
+        assert refreshed[0]["description"] == "Brunch"
+
     @pytest.mark.gui
     def test_report_view_updates(self, main_window_with_ui):
         """Test report view update methods"""
         window = main_window_with_ui
 
-        # Mock table methods
-        window.report_table.setRowCount = Mock()
-        window.report_table.setItem = Mock()
+        # Mock the report model
+        window.report_model = Mock()
         window.summary_label.setText = Mock()
 
         # FIX: Mock the date methods
@@ -280,9 +334,38 @@ class TestMainWindow:
         window.update_report_date_ranges()
 
         # Verify methods were called
-        window.report_table.setRowCount.assert_called()
+        window.report_model.set_rows.assert_called_once_with(
+            window.get_filtered_expenses.return_value
+        )
         window.summary_label.setText.assert_called()
 
+    @pytest.mark.gui
+    def test_report_summary_reused_for_same_filtered_list(self, main_window_with_ui):
+        """The summary is only recomputed when the filtered list changes"""
+        window = main_window_with_ui
+        window.report_model = Mock()
+        window.summary_label.setText = Mock()
+        filtered = [
+            {"category": "Food", "amount": 25.5, "date": "2023-01-01"},
+            {"category": "Bills", "amount": 10.0, "date": "2023-01-02"},
+        ]
+        window.get_filtered_expenses = Mock(return_value=filtered)
+
+        window.update_report_view()
+        summary = window._report_summary
+        window.update_report_view()
+
+        assert window._report_summary is summary
+        window.summary_label.setText.assert_called_with(
+            "Summary: 2 expenses | Categories: Bills, Food | Total: ₱35.50"
+        )
+
+        window.get_filtered_expenses.return_value = filtered[:1]
+        window.update_report_view()
+        window.summary_label.setText.assert_called_with(
+            "Summary: 1 expenses | Categories: Food | Total: ₱25.50"
+        )
+
     @pytest.mark.gui
     def test_export_functionality(self, main_window_with_ui):
         """Test export methods"""
@@ -3,6 +3,7 @@ import pytest
 
 from expense_tracker_app.table_helpers import (aggregate_category_totals,
                                                calculate_subtotal,
+                                               compute_totals,
                                                format_expense_row,
                                                format_total_row,
                                                prepare_chart_data,
@@ -42,6 +43,18 @@ class TestTableHelpers:
         result = calculate_subtotal([])
         assert result == 0.0
 
+    @pytest.mark.unit
+    def test_compute_totals(self):
+        """Test subtotals and grand total come from one pass"""
+        data = {
+            "Food": [{"amount": 10.1}, {"amount": None}, {"amount": "2.2"}],
+            "Travel": [],
+        }
+        subtotals, grand_total = compute_totals(data)
+        assert subtotals == {"Food": pytest.approx(12.3), "Travel": 0.0}
+        assert list(subtotals) == ["Food", "Travel"]
+        assert grand_total == pytest.approx(12.3)
+
     @pytest.mark.unit
     def test_format_expense_row(self):
         """Test expense row formatting"""
@@ -10,7 +10,8 @@ from PyQt5.QtWidgets import (QApplication, QLabel, QMessageBox, QPushButton,
                              QTableWidgetItem, QVBoxLayout, QWidget)
 
 from expense_tracker_app.widgets import (DashboardWidget, ExpenseTracker,
-                                         NumericTableWidgetItem)
+                                         NumericTableWidgetItem,
+                                         ReportTableModel)
 
 try:
     from matplotlib.backends.backend_pdf import PdfPages
@@ -69,6 +70,36 @@ class TestNumericTableWidgetItem:
         assert not (grand_item < regular_item)
 
 
+    @pytest.mark.gui
+    def test_lt_uses_cached_sort_value(self):
+        """Test the numeric key follows text changes and explicit values"""
+        item1 = NumericTableWidgetItem("₱1,000.00")
+        item2 = NumericTableWidgetItem("₱50.00", 50.0)
+        assert item2 < item1
+
+        item1.setText("₱5.00")
+        assert item1 < item2
+
+class TestReportTableModel:
+    @pytest.mark.gui
+    def test_rows_display_expense_fields(self, qapp):
+        """ReportTableModel shows one filtered expense per row"""
+        model = ReportTableModel()
+        model.set_rows(
+            [
+                {"category": "Food", "amount": 25.5, "date": "2023-01-01", "description": "Lunch"},
+                {"category": "Travel", "amount": 100.0, "date": "2023-01-03"},
+            ]
+        )
+
+        assert model.rowCount() == 2
+        assert model.columnCount() == 4
+        assert model.headerData(1, Qt.Horizontal) == "Amount"
+        assert model.index(0, 1).data() == "25.5"
+        assert model.index(1, 0).data() == "Travel"
+        assert model.index(1, 3).data() == ""
+
+
 class TestExpenseTracker:
     @pytest.mark.gui
     @pytest.fixture
@@ -87,6 +118,7 @@ class TestExpenseTracker:
                 ],
             }
             mock_dm.get_sorted_expenses.return_value = mock_dm.expenses
+            mock_dm.get_sorted_categories.return_value = ("Food", "Travel")
             mock_dm.get_category_subtotals.return_value = {
                 "Food": 41.25,
                 "Travel": 100.00,
@@ -196,6 +228,54 @@ class TestExpenseTracker:
 
                 mock_dm.search_expenses.assert_called_once_with("Lunch")
 
+    @pytest.mark.gui
+    def test_search_expenses_skips_rerender_of_same_results(self, expense_tracker):
+        expense_tracker.search_input.setText("Lunch")
+
+        with patch.object(
+            expense_tracker, "render_table", wraps=expense_tracker.render_table
+        ) as render:
+            expense_tracker.search_expenses()
+            expense_tracker.search_expenses()
+            assert render.call_count == 1
+
+            expense_tracker.show_expense()
+            expense_tracker.search_expenses()
+            assert render.call_count == 3
+
+    @pytest.mark.gui
+    def test_refresh_category_dropdowns_rebuilds_only_on_change(self, expense_tracker):
+        from expense_tracker_app.dialogs import AddExpenseDialog
+
+        dialog = AddExpenseDialog(["Food", "Travel", "Utilities"])
+        dialog.category_dropdown.setCurrentIndex(1)
+
+        with patch.object(dialog.category_dropdown, "clear") as mock_clear:
+            expense_tracker.refresh_category_dropdowns()
+            mock_clear.assert_not_called()
+
+        expense_tracker.data_manager.categories = ["Books", "Food", "Travel", "Utilities"]
+        expense_tracker.refresh_category_dropdowns()
+
+        assert dialog.category_dropdown.count() == 4
+        assert dialog.category_dropdown.currentText() == "Travel"
+        dialog.deleteLater()
+
+    @pytest.mark.gui
+    def test_pin_grand_total_row_reapplies_span_only_on_change(self, expense_tracker):
+        table = expense_tracker.table
+        expense_tracker.render_table(expense_tracker.data_manager.expenses, show_totals=True)
+        grand_row = expense_tracker.model.pinned_row
+        assert table.columnSpan(grand_row, 2) == 3
+
+        with patch.object(table, "setSpan") as mock_span:
+            expense_tracker.model.sort(1, Qt.DescendingOrder)
+            mock_span.assert_not_called()
+        assert expense_tracker.model.pinned_row == grand_row
+
+        expense_tracker.render_table(expense_tracker.data_manager.expenses)
+        assert table.columnSpan(grand_row, 2) == 1
+
     @pytest.mark.gui
     def test_search_expenses_empty(self, expense_tracker):
         """Test expense search with empty query"""
@@ -203,7 +283,7 @@ class TestExpenseTracker:
         expense_tracker.search_expenses()
 
         # Should show all expenses
-        assert expense_tracker.table.rowCount() > 0
+        assert expense_tracker.table.model().rowCount() > 0
 
     @pytest.mark.gui
     def test_clear_search(self, expense_tracker):
@@ -224,7 +304,7 @@ class TestExpenseTracker:
         expense_tracker.show_total_expense()
 
         # Should show subtotal rows
-        assert expense_tracker.table.rowCount() > 0
+        assert expense_tracker.table.model().rowCount() > 0
         # Should include grand total
         summary_text = expense_tracker.summary_label.text()
         assert "Total:" in summary_text
@@ -430,7 +510,7 @@ class TestExpenseTracker:
 
         expense_tracker.render_table(data)
 
-        assert expense_tracker.table.rowCount() > 0
+        assert expense_tracker.table.model().rowCount() > 0
         assert "Total:" in expense_tracker.summary_label.text()
 
     @pytest.mark.gui
@@ -439,8 +519,18 @@ class TestExpenseTracker:
         expense_tracker.render_table({})
 
         # Should show "No data available" message
-        assert expense_tracker.table.rowCount() == 1
-        assert expense_tracker.table.item(0, 0).text() == "📊 No data available"
+        assert expense_tracker.table.model().rowCount() == 1
+        assert expense_tracker.table.model().index(0, 0).data() == "📊 No data available"
+
+    @pytest.mark.gui
+    def test_render_table_categories_without_records(self, expense_tracker):
+        """Categories with no records still show the empty state"""
+        expense_tracker.render_table({"Food": []})
+
+        model = expense_tracker.table.model()
+        assert model.rowCount() == 1
+        assert model.index(0, 0).data() == "📊 No data available"
+        assert expense_tracker.summary_label.text() == "Total: ₱0.00"
 
     @pytest.mark.gui
     def test_render_table_with_totals(self, expense_tracker):
@@ -452,7 +542,131 @@ class TestExpenseTracker:
         expense_tracker.render_table(data, show_totals=True)
 
         # Should include subtotal and grand total rows
-        assert expense_tracker.table.rowCount() > 1
+        assert expense_tracker.table.model().rowCount() > 1
+
+    @pytest.mark.gui
+    def test_render_table_sort_keeps_grand_total_last(self, expense_tracker):
+        """Sorting by amount keeps the grand total row pinned at the bottom"""
+        data = {
+            "Food": [{"amount": 25.50, "date": "2023-01-01", "description": "Lunch"}],
+            "Bills": [{"amount": 5.00, "date": "2023-01-02", "description": "Water"}],
+        }
+
+        expense_tracker.render_table(data, show_totals=True)
+        expense_tracker.table.sortByColumn(1, Qt.DescendingOrder)
+
+        model = expense_tracker.table.model()
+        assert [model.index(r, 0).data() for r in range(model.rowCount())] == [
+            "Food",
+            "Bills",
+            "Grand Total",
+        ]
+        assert model.index(2, 0).data(Qt.UserRole) == "grand_total"
+        assert model.pinned_row == 2
+        assert expense_tracker.table.columnSpan(2, 2) == 3
+
+    @pytest.mark.gui
+    def test_model_sort_without_column_keeps_order(self, expense_tracker):
+        """sort(-1) means no sort column and leaves rows untouched"""
+        data = {
+            "Food": [
+                {"amount": 5.00, "date": "2023-01-01", "description": "Zebra"},
+                {"amount": 9.00, "date": "2023-01-02", "description": "Apple"},
+            ],
+        }
+
+        expense_tracker.render_table(data)
+        model = expense_tracker.table.model()
+        before = list(model.descriptions)
+        model.sort(-1)
+
+        assert model.descriptions == before
+
+    @pytest.mark.gui
+    def test_render_table_formats_amounts_on_display(self, expense_tracker):
+        """Amount text is formatted when first requested, not during render"""
+        expense_tracker.render_table(
+            {"Food": [{"amount": None, "date": "2023-01-01", "description": "Free"}]}
+        )
+
+        model = expense_tracker.table.model()
+        assert model.amount_texts == [None]
+        assert model.index(0, 1).data() == "0.00"
+        assert model.amount_texts == ["0.00"]
+
+    @pytest.mark.gui
+    def test_action_delegate_dispatches_edit(self, expense_tracker):
+        """Edit clicks from the actions delegate reach edit_expense"""
+        record = {"amount": 25.50, "date": "2023-01-01", "description": "Lunch"}
+        expense_tracker.render_table({"Food": [record]})
+
+        with patch.object(expense_tracker, "edit_expense") as mock_edit:
+            expense_tracker.action_delegate.editClicked.emit(0)
+
+        mock_edit.assert_called_once_with("Food", record)
+
+    @pytest.mark.gui
+    def test_action_delegate_hit_testing(self, expense_tracker):
+        """Clicks are routed by which painted button contains the position"""
+        from PyQt5.QtCore import QEvent, QPoint, QRect
+        from PyQt5.QtGui import QMouseEvent
+        from PyQt5.QtWidgets import QStyleOptionViewItem
+
+        expense_tracker.render_table(
+            {"Food": [{"amount": 25.50, "date": "2023-01-01", "description": "Lunch"}]}
+        )
+        delegate = expense_tracker.action_delegate
+        model = expense_tracker.table.model()
+        index = model.index(0, 4)
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 170, 50)
+        edit_rect, delete_rect = delegate._button_rects(option.rect)
+
+        def release_at(point):
+            return QMouseEvent(
+                QEvent.MouseButtonRelease, point, Qt.LeftButton, Qt.LeftButton,
+                Qt.NoModifier,
+            )
+
+        with patch.object(expense_tracker, "edit_expense") as mock_edit, patch.object(
+            expense_tracker, "delete_expense"
+        ) as mock_delete:
+            assert delegate.editorEvent(
+                release_at(delete_rect.center()), model, option, index
+            )
+            assert not delegate.editorEvent(
+                release_at(QPoint(169, 49)), model, option, index
+            )
+
+        mock_delete.assert_called_once()
+        mock_edit.assert_not_called()
+        assert not edit_rect.intersects(delete_rect)
+
+    @pytest.mark.gui
+    def test_action_delegate_ignores_total_rows(self, expense_tracker):
+        """Subtotal rows have no action buttons to click"""
+        from PyQt5.QtCore import QEvent, QRect
+        from PyQt5.QtGui import QMouseEvent
+        from PyQt5.QtWidgets import QStyleOptionViewItem
+
+        expense_tracker.render_table(
+            {"Food": [{"amount": 25.50, "date": "2023-01-01", "description": "Lunch"}]},
+            show_totals=True,
+        )
+        delegate = expense_tracker.action_delegate
+        model = expense_tracker.table.model()
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 170, 50)
+        edit_rect, _ = delegate._button_rects(option.rect)
+        event = QMouseEvent(
+            QEvent.MouseButtonRelease, edit_rect.center(), Qt.LeftButton,
+            Qt.LeftButton, Qt.NoModifier,
+        )
+
+        with patch.object(expense_tracker, "edit_expense") as mock_edit:
+            assert not delegate.editorEvent(event, model, option, model.index(0, 4))
+
+        mock_edit.assert_not_called()
 
     @pytest.mark.gui
     def test_refresh_category_dropdowns(self, qtbot):
@@ -683,6 +897,107 @@ class TestDashboardWidget:
     def test_update_chart_filters(self, dashboard_widget):
         pass
 
+    @pytest.mark.gui
+    def test_update_dashboard_deferred_until_shown(self, qtbot, tmp_path):
+        from expense_tracker_app.data_manager import DataManager
+        from expense_tracker_app.widgets import DashboardWidget
+
+        dm = DataManager(file_path=str(tmp_path / "expenses.json"))
+        dashboard = DashboardWidget(dm)
+        qtbot.addWidget(dashboard)
+
+        with patch.object(dashboard, "update_summary_tab") as summary, patch.object(
+            dashboard, "update_charts_tab"
+        ) as charts, patch.object(dashboard, "update_trends_tab") as trends:
+            dashboard.update_dashboard()
+            summary.assert_not_called()
+
+            dashboard.show()
+            qtbot.waitUntil(lambda: summary.call_count == 1)
+            charts.assert_not_called()
+
+            dashboard.tabs.setCurrentWidget(dashboard.charts_tab)
+            dashboard.tabs.setCurrentWidget(dashboard.summary_tab)
+            dashboard.tabs.setCurrentWidget(dashboard.charts_tab)
+            assert (summary.call_count, charts.call_count) == (1, 1)
+            trends.assert_not_called()
+
+    @pytest.mark.gui
+    def test_hidden_dashboard_refreshes_summary_when_shown(self, qtbot, tmp_path):
+        from expense_tracker_app.data_manager import DataManager
+        from expense_tracker_app.widgets import DashboardWidget
+
+        dm = DataManager(file_path=str(tmp_path / "expenses.json"))
+        dashboard = DashboardWidget(dm)
+        qtbot.addWidget(dashboard)
+
+        dm.expenses = {"Food": [{"amount": 12.5, "date": "2023-01-01"}]}
+        dm.save_data()
+        dashboard.update_dashboard()
+
+        # Hidden: the chart filter follows the data, the summary waits
+        assert dashboard.chart_category_filter.findText("Food") >= 0
+        assert dashboard.total_label.text() != "Grand Total: ₱12.50"
+
+        dashboard.show()
+        qtbot.waitUntil(
+            lambda: dashboard.total_label.text() == "Grand Total: ₱12.50"
+        )
+        assert dashboard.summary_table.item(0, 0).text() == "Food"
+
+    @pytest.mark.gui
+    def test_get_filtered_chart_data_parses_non_canonical_dates(self, qtbot, tmp_path):
+        from PyQt5.QtCore import QDate
+
+        from expense_tracker_app.data_manager import DataManager
+        from expense_tracker_app.widgets import DashboardWidget
+
+        dm = DataManager(file_path=str(tmp_path / "expenses.json"))
+        dm.expenses = {
+            "Food": [
+                {"amount": 1.0, "date": "2023-09-14"},
+                {"amount": 2.0, "date": "2023-9-15"},
+                {"amount": 3.0, "date": "2023-02-30"},
+                {"amount": 4.0, "date": "2023-10-01"},
+                {"amount": 5.0, "date": None},
+            ]
+        }
+        dashboard = DashboardWidget(dm)
+        qtbot.addWidget(dashboard)
+        dashboard.chart_category_filter.addItem("All Categories")
+        dashboard.chart_category_filter.setCurrentText("All Categories")
+        dashboard.chart_start_date.setDate(QDate(2023, 1, 1))
+        dashboard.chart_end_date.setDate(QDate(2023, 9, 30))
+
+        filtered = dashboard.get_filtered_chart_data()
+
+        assert [e["amount"] for e in filtered["Food"]] == [1.0, 2.0]
+
+    @pytest.mark.gui
+    def test_update_chart_filters_skips_unchanged_categories(self, qtbot):
+        mock_dm = Mock()
+        mock_dm.get_all_categories.return_value = ["Food", "Travel"]
+
+        from expense_tracker_app.widgets import DashboardWidget
+
+        with patch.object(DashboardWidget, "init_summary_tab"), patch.object(
+            DashboardWidget, "init_charts_tab"
+        ), patch.object(DashboardWidget, "init_trends_tab"):
+            dashboard = DashboardWidget(mock_dm)
+            qtbot.addWidget(dashboard)
+
+        dashboard.chart_category_filter = Mock()
+        dashboard.chart_category_filter.findText.return_value = -1
+
+        dashboard.update_chart_filters()
+        dashboard.update_chart_filters()
+        assert dashboard.chart_category_filter.clear.call_count == 1
+
+        mock_dm.get_all_categories.return_value = ["Food"]
+        dashboard.update_chart_filters()
+        assert dashboard.chart_category_filter.clear.call_count == 2
+        dashboard.chart_category_filter.addItems.assert_called_with(["Food"])
+
     @pytest.mark.gui
     @pytest.mark.skip(reason="Dashboard UI complexity - focus on core functionality")
     def test_get_filtered_chart_data(self, dashboard_widget):